@@ -1,10 +1,29 @@
+import time
+from config import Config
+from utils.profiler import StartupProfiler
+
+# Start timing imports before discord.py is pulled in (only when STARTUP_PROFILE=1)
+profiler = StartupProfiler(enabled=Config.STARTUP_PROFILE, process_start=time.perf_counter())
+profiler.install()
+
 import discord
 from discord.ext import commands
 import asyncio
 import logging
 import os
-from config import Config
+from typing import Optional
 from utils.logger import setup_logger
+from utils import responses
+from utils.database import Database
+from utils.ban_list import GlobalBanList
+from utils.bulk_jobs import BulkCheckpoint
+from utils.guild_config import GuildConfigStore
+from utils.modlog import ModLogDispatcher
+from utils.watchdog import LoopWatchdog
+from utils.members import MemberResolver
+from utils.help import HelpIndex
+from utils.health import HealthServer
+from utils.lifecycle import Lifecycle
 
 # Setup logging
 logger = setup_logger()
@@ -13,27 +32,47 @@ logger = setup_logger()
 intents = discord.Intents.default()
 intents.message_content = True  # Re-enabled with permissions
 intents.guilds = True
-intents.members = False  # Disabled privileged intent
+intents.members = Config.MEMBERS_INTENT  # Privileged intent, off by default
 
 bot = commands.Bot(
     command_prefix='!',  # Keep prefix for compatibility
     intents=intents,
     help_command=None,
-    case_insensitive=True
+    case_insensitive=True,
+    chunk_guilds_at_startup=False,  # Only hot guilds are chunked, see MemberResolver
+    # Sent with every IDENTIFY, so the status survives reconnects without a presence update
+    activity=discord.Activity(type=discord.ActivityType.watching, name="for moderation")
 )
 
-# Global variables for tracking
-muted_users = {}  # {user_id: {guild_id: role_id}}
+# Shared persistent state (loaded lazily on first use)
+bot.db = Database(Config.DATABASE_PATH)
+bot.ban_list = GlobalBanList(bot.db)
+bot.bulk_checkpoints = BulkCheckpoint(bot.db, Config.BULK_CHECKPOINT_TTL_HOURS * 3600)
+bot.guild_config = GuildConfigStore(bot.db)
+bot.modlog = ModLogDispatcher(bot)
+bot.watchdog = LoopWatchdog(Config.WATCHDOG_INTERVAL, Config.WATCHDOG_THRESHOLD)
+bot.members = MemberResolver(bot, Config.MEMBER_CACHE_SIZE, Config.MEMBER_CACHE_TTL)
+bot.help_index = HelpIndex()
+bot.health = HealthServer(bot)
+bot.lifecycle = Lifecycle(bot)
+# A new session rebuilds every Guild with an empty member cache, whatever its fingerprint
+bot.lifecycle.add_warmer(bot.members.warm_guild, always=True)
+for store in (bot.members, bot.modlog, bot.guild_config):
+    bot.lifecycle.track(store)
+
+UNKNOWN_COMMAND = responses.error("Unknown command. Pick one from the suggestions.")
 
 @bot.event
 async def on_ready():
-    """Event triggered when bot is ready"""
+    """Event triggered when bot is ready (again after every new gateway session)"""
     logger.info(f'{bot.user} has connected to Discord!')
     logger.info(f'Bot is in {len(bot.guilds)} guilds')
-    
-    # Set bot status
-    activity = discord.Activity(type=discord.ActivityType.watching, name="for moderation")
-    await bot.change_presence(activity=activity)
+
+@bot.lifecycle.once
+async def initial_setup():
+    """One-time setup on the first READY, reconnects don't repeat it"""
+    profiler.uninstall()
+    profiler.report(logger)
     
     # Sync slash commands
     try:
@@ -42,17 +81,22 @@ async def on_ready():
     except Exception as e:
         logger.error(f'Failed to sync commands: {e}')
 
+@bot.lifecycle.on_ready
+async def drop_stale_members():
+    """Cached members point at the Guild objects of the previous session"""
+    bot.members.clear()
+
+@bot.lifecycle.on_resume
+async def on_session_resumed():
+    logger.info('Gateway session resumed, no refresh needed')
+
 @bot.event
 async def on_command_error(ctx, error):
     """Global error handler"""
     if isinstance(error, commands.CommandNotFound):
         return
     elif isinstance(error, commands.MissingPermissions):
-        embed = discord.Embed(
-            title="❌ Missing Permissions",
-            description="You don't have the required permissions to use this command.",
-            color=discord.Color.red()
-        )
+        embed = responses.missing_permissions("You don't have the required permissions to use this command.")
         await ctx.send(embed=embed)
     elif isinstance(error, commands.CommandOnCooldown):
         embed = discord.Embed(
@@ -70,69 +114,61 @@ async def on_command_error(ctx, error):
         await ctx.send(embed=embed)
     else:
         logger.error(f'Unexpected error: {error}')
-        embed = discord.Embed(
-            title="❌ Error",
-            description="An unexpected error occurred. Please try again later.",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=responses.UNEXPECTED_ERROR)
 
 @bot.tree.command(name='help', description='Display help information')
-async def help_command(interaction: discord.Interaction):
+@discord.app_commands.describe(command='Show details for a single command')
+async def help_command(interaction: discord.Interaction, command: Optional[str] = None):
     """Display help information"""
-    embed = discord.Embed(
-        title="🤖 Bot Commands",
-        description="Multi-purpose Discord bot with global moderation capabilities",
-        color=discord.Color.blue()
-    )
-    
-    # Basic moderation commands
-    embed.add_field(
-        name="🔨 Basic Moderation",
-        value="`/ban <user> [reason]` - Ban a user\n"
-              "`/kick <user> [reason]` - Kick a user\n"
-              "`/mute <user> [reason]` - Mute a user\n"
-              "`/unmute <user>` - Unmute a user",
-        inline=False
-    )
-    
-    # Owner-only commands
-    if interaction.user.id == Config.OWNER_ID:
-        embed.add_field(
-            name="👑 Owner Commands",
-            value="`/globalban <user_id> [reason]` - Ban user from all servers\n"
-                  "`/globalkick <user_id> [reason]` - Kick user from all servers\n"
-                  "`/globalmute <user_id> [reason]` - Mute user in all servers\n"
-                  "`/globalunmute <user_id>` - Unmute user from all servers\n"
-                  "`/servers` - List all servers bot is in\n"
-                  "`/leaveserver <server_id>` - Leave a specific server\n"
-                  "`/shutdown` - Shutdown the bot",
-            inline=False
-        )
-    
-    embed.add_field(
-        name="ℹ️ Information",
-        value=f"Commands: Slash commands only\n"
-              f"Owner: <@{Config.OWNER_ID}>",
-        inline=False
-    )
+    is_owner = interaction.user.id == Config.OWNER_ID
+    if command is None:
+        embed = bot.help_index.overview(is_owner)
+    else:
+        embed = bot.help_index.detail(command, is_owner) or UNKNOWN_COMMAND
     
     await interaction.response.send_message(embed=embed)
 
-async def load_cogs():
-    """Load all cogs"""
-    cogs = ['cogs.moderation_slash', 'cogs.owner_slash']
+@help_command.autocomplete('command')
+async def help_command_autocomplete(interaction: discord.Interaction, current: str):
+    return bot.help_index.choices(current, interaction.user.id == Config.OWNER_ID)
+
+async def on_first_interaction(interaction: discord.Interaction):
+    """Report time from process start to the first interaction (profile mode only)"""
+    if profiler.mark_first_interaction():
+        logger.info(f'Startup profile: first interaction handled {profiler.first_interaction:.2f}s after process start')
+        bot.remove_listener(on_first_interaction, 'on_interaction')
+
+async def load_cogs(cogs):
+    """Load the given cogs, skipping any that are already loaded"""
     for cog in cogs:
+        if cog in bot.extensions:
+            continue
         try:
+            start = time.perf_counter()
             await bot.load_extension(cog)
+            profiler.record_cog(cog, time.perf_counter() - start)
             logger.info(f'Loaded cog: {cog}')
         except Exception as e:
             logger.error(f'Failed to load cog {cog}: {e}')
+    
+    # Help is generated from the tree, so rebuild it whenever commands change
+    if bot.help_index.refresh(bot.tree):
+        logger.info('Rebuilt help embeds')
 
 async def main():
     """Main function to run the bot"""
     async with bot:
-        await load_cogs()
+        await load_cogs(Config.COGS)
+        bot.modlog.start()
+        bot.watchdog.start()
+        if Config.HEALTH_PORT:
+            try:
+                await bot.health.start(Config.HEALTH_HOST, Config.HEALTH_PORT)
+            except OSError as e:
+                # e.g. port already in use; the bot itself doesn't need the endpoint
+                logger.warning(f'Health endpoint disabled, could not listen on {Config.HEALTH_HOST}:{Config.HEALTH_PORT}: {e}')
+        if profiler.enabled:
+            bot.add_listener(on_first_interaction, 'on_interaction')
         await bot.start(Config.TOKEN)
 
 if __name__ == '__main__':
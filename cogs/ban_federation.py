@@ -0,0 +1,112 @@
+import discord
+from discord.ext import commands, tasks
+from utils.logger import setup_logger
+from utils.ban_list import GLOBAL_BAN_REASON
+from config import Config
+
+logger = setup_logger()
+
+class BanFederation(commands.Cog):
+    """Applies the global ban list to every guild the bot is in"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.synced = set()  # Guild IDs swept since the bot joined them
+
+    async def cog_load(self):
+        self.reconcile.change_interval(hours=Config.BAN_SYNC_INTERVAL_HOURS)
+        self.reconcile.start()
+        self.bot.lifecycle.add_warmer(self.warm_guild)
+        self.bot.lifecycle.track(self)
+
+    async def cog_unload(self):
+        self.reconcile.cancel()
+        self.bot.lifecycle.remove_warmer(self.warm_guild)
+        self.bot.lifecycle.untrack(self)
+
+    def forget_guild(self, guild_id):
+        self.synced.discard(guild_id)
+
+    def compact(self, active_guild_ids):
+        """Forget guilds the bot left so a rejoin is swept again"""
+        stale = self.synced - active_guild_ids
+        self.synced -= stale
+        return len(stale)
+
+    async def sync_guild(self, guild):
+        """Ban every listed user that is not already banned in the guild"""
+        ban_list = self.bot.ban_list
+        await ban_list.load()
+        if not ban_list:
+            return 0
+
+        perms = guild.me.guild_permissions
+        if not (perms.ban_members and perms.manage_guild):
+            return 0
+
+        # One paginated request per 1000 bans instead of one request per listed user
+        banned_ids = {entry.user.id async for entry in guild.bans(limit=None)}
+        missing = sorted(ban_list.missing_from(banned_ids))
+        if not missing:
+            return 0
+
+        applied = 0
+        chunk_size = Config.BULK_BAN_CHUNK_SIZE
+        for i in range(0, len(missing), chunk_size):
+            chunk = [discord.Object(id=user_id) for user_id in missing[i:i + chunk_size]]
+            result = await guild.bulk_ban(
+                chunk,
+                reason=f"{GLOBAL_BAN_REASON} list sync",
+                delete_message_seconds=0
+            )
+            applied += len(result.banned)
+
+        if applied:
+            embed = discord.Embed(
+                title="🌍 Global Ban List Sync",
+                description=f"Applied **{applied}** bans from the global ban list.",
+                color=discord.Color.red(),
+                timestamp=discord.utils.utcnow()
+            )
+            self.bot.modlog.log(guild, embed)
+        logger.info(f'Ban sync: applied {applied}/{len(missing)} missing global bans in {guild.name}')
+        return applied
+
+    async def warm_guild(self, guild):
+        """Lifecycle warmer: sweep a guild once after startup or joining it
+
+        Guilds already swept are left to the reconcile loop, so a reconnect
+        doesn't page through every guild's bans again.
+        """
+        if guild.id in self.synced:
+            return
+        try:
+            await self.sync_guild(guild)
+            self.synced.add(guild.id)
+        except discord.Forbidden:
+            logger.warning(f'Ban sync: missing permissions in {guild.name}')
+        except Exception as e:
+            logger.error(f'Ban sync failed for {guild.name}: {e}')
+
+    @tasks.loop(hours=6)
+    async def reconcile(self):
+        """Periodically bring every guild's bans in line with the global list"""
+        if self.reconcile.current_loop == 0:
+            return  # The startup warm-up already swept every guild
+        applied = 0
+        for guild in list(self.bot.guilds):
+            try:
+                applied += await self.sync_guild(guild)
+            except discord.Forbidden:
+                continue
+            except Exception as e:
+                logger.error(f'Ban sync failed for {guild.name}: {e}')
+        if applied:
+            logger.info(f'Ban sync: reconciliation applied {applied} bans')
+
+    @reconcile.before_loop
+    async def before_reconcile(self):
+        await self.bot.wait_until_ready()
+
+async def setup(bot):
+    await bot.add_cog(BanFederation(bot))
@@ -0,0 +1,175 @@
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from typing import Optional
+from utils.logger import setup_logger
+from utils import responses
+from utils.guild_config import MUTE_BACKENDS
+from config import Config
+
+logger = setup_logger()
+
+class ConfigSlash(commands.Cog):
+    """Per-guild configuration commands"""
+
+    help_section = "⚙️ Server Settings"
+
+    config = app_commands.Group(name='config', description='View or change this server\'s bot settings', guild_only=True)
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_load(self):
+        await self.bot.guild_config.load()
+        self.reload_settings.change_interval(seconds=Config.GUILD_CONFIG_RELOAD_SECONDS)
+        self.reload_settings.start()
+        self.bot.lifecycle.add_warmer(self.warm_guild)
+
+    async def cog_unload(self):
+        self.reload_settings.cancel()
+        self.bot.lifecycle.remove_warmer(self.warm_guild)
+
+    async def warm_guild(self, guild):
+        """Lifecycle warmer: bring back settings dropped when the bot left the guild"""
+        await self.bot.guild_config.activate(guild.id)
+
+    @tasks.loop(seconds=60)
+    async def reload_settings(self):
+        """Pick up settings edited outside this process"""
+        try:
+            changed = await self.bot.guild_config.reload()
+            if changed:
+                logger.info(f'Reloaded settings for {changed} guilds')
+        except Exception as e:
+            logger.error(f'Failed to reload guild settings: {e}')
+
+    async def check_access(self, interaction: discord.Interaction):
+        """Only server managers and the bot owner may change settings"""
+        if interaction.user.id == Config.OWNER_ID or interaction.user.guild_permissions.manage_guild:
+            return True
+        embed = responses.missing_permissions("You need the Manage Server permission to change bot settings.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return False
+
+    async def update(self, interaction: discord.Interaction, key, value, shown):
+        """Persist one setting and confirm it"""
+        await self.bot.guild_config.set(interaction.guild.id, key, value)
+        embed = discord.Embed(
+            title="⚙️ Setting Updated",
+            description=f"`{key}` is now {shown}.",
+            color=discord.Color.green()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        logger.info(f'{interaction.user} set {key}={value!r} in {interaction.guild.name}')
+
+    @config.command(name='show', description='Show this server\'s bot settings')
+    async def show(self, interaction: discord.Interaction):
+        """Show this server's bot settings"""
+        settings = self.bot.guild_config.get(interaction.guild.id)
+        log_channel = settings['log_channel_id']
+        moderator_roles = settings['moderator_role_ids']
+
+        embed = discord.Embed(
+            title="⚙️ Server Settings",
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="Mute Role", value=settings['mute_role'], inline=True)
+        embed.add_field(name="Mute Backend", value=settings['mute_backend'], inline=True)
+        embed.add_field(name="Log Channel", value=f"<#{log_channel}>" if log_channel else "Not set", inline=True)
+        embed.add_field(
+            name="Automod",
+            value=f"Max mentions: {settings['automod_max_mentions']}\n"
+                  f"Max messages / 10s: {settings['automod_max_messages']}",
+            inline=True
+        )
+        embed.add_field(
+            name="Moderator Roles",
+            value=" ".join(f"<@&{role_id}>" for role_id in moderator_roles) if moderator_roles else "None",
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @config.command(name='muterole', description='Set the name of the mute role')
+    @app_commands.describe(name='Name of the role used to mute members')
+    async def mute_role(self, interaction: discord.Interaction, name: app_commands.Range[str, 1, 100]):
+        """Set the name of the mute role"""
+        if await self.check_access(interaction):
+            await self.update(interaction, 'mute_role', name, f"**{name}**")
+
+    @config.command(name='mutebackend', description='Choose how members are muted')
+    @app_commands.describe(backend='Use a mute role or Discord\'s built-in timeout')
+    @app_commands.choices(backend=[app_commands.Choice(name=backend, value=backend) for backend in MUTE_BACKENDS])
+    async def mute_backend(self, interaction: discord.Interaction, backend: app_commands.Choice[str]):
+        """Choose how members are muted"""
+        if await self.check_access(interaction):
+            await self.update(interaction, 'mute_backend', backend.value, f"**{backend.value}**")
+
+    @config.command(name='logchannel', description='Set or clear the moderation log channel')
+    @app_commands.describe(channel='Channel for moderation logs (leave empty to disable)')
+    async def log_channel(self, interaction: discord.Interaction, channel: Optional[discord.TextChannel] = None):
+        """Set or clear the moderation log channel"""
+        if await self.check_access(interaction):
+            await self.update(
+                interaction, 'log_channel_id',
+                channel.id if channel else None,
+                channel.mention if channel else "disabled"
+            )
+
+    @config.command(name='automod', description='Set automod thresholds')
+    @app_commands.describe(max_mentions='Mentions allowed in one message', max_messages='Messages allowed per 10 seconds')
+    async def automod(
+        self,
+        interaction: discord.Interaction,
+        max_mentions: Optional[app_commands.Range[int, 1, 100]] = None,
+        max_messages: Optional[app_commands.Range[int, 1, 100]] = None
+    ):
+        """Set automod thresholds"""
+        if not await self.check_access(interaction):
+            return
+        if max_mentions is not None:
+            await self.bot.guild_config.set(interaction.guild.id, 'automod_max_mentions', max_mentions)
+        if max_messages is not None:
+            await self.bot.guild_config.set(interaction.guild.id, 'automod_max_messages', max_messages)
+
+        settings = self.bot.guild_config.get(interaction.guild.id)
+        embed = discord.Embed(
+            title="⚙️ Setting Updated",
+            description=f"Max mentions: {settings['automod_max_mentions']}\n"
+                        f"Max messages / 10s: {settings['automod_max_messages']}",
+            color=discord.Color.green()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @config.command(name='modrole', description='Allow or disallow a role to use moderation commands')
+    @app_commands.describe(role='The role to change', allowed='Whether the role may moderate')
+    async def mod_role(self, interaction: discord.Interaction, role: discord.Role, allowed: bool):
+        """Allow or disallow a role to use moderation commands"""
+        if not await self.check_access(interaction):
+            return
+        current = self.bot.guild_config.get(interaction.guild.id)['moderator_role_ids']
+        if allowed:
+            role_ids = current if role.id in current else current + (role.id,)
+        else:
+            role_ids = tuple(role_id for role_id in current if role_id != role.id)
+        await self.update(
+            interaction, 'moderator_role_ids', role_ids,
+            " ".join(f"<@&{role_id}>" for role_id in role_ids) if role_ids else "empty"
+        )
+
+    @config.command(name='reload', description='Reload settings from the database', extras={'owner_only': True})
+    async def reload(self, interaction: discord.Interaction):
+        """Reload settings from the database"""
+        if interaction.user.id != Config.OWNER_ID:
+            embed = responses.ACCESS_DENIED
+            return await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        changed = await self.bot.guild_config.reload()
+        embed = discord.Embed(
+            title="⚙️ Settings Reloaded",
+            description=f"Refreshed settings for {changed} servers.",
+            color=discord.Color.green()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(ConfigSlash(bot))
@@ -1,25 +1,104 @@
+import asyncio
+import time
 import discord
+from discord import app_commands
 from discord.ext import commands
 from utils.logger import setup_logger
+from utils import responses
+from utils.guild_config import is_moderator
+from utils.modlog import modlog_embed
 from config import Config
 
 logger = setup_logger()
 
+def target_error(author_member, member, verb):
+    """Owner protection and role hierarchy checks, returns an error embed or None"""
+    if member.id == Config.OWNER_ID:
+        return responses.owner_protection()
+    if member.top_role >= author_member.top_role and author_member.id != Config.OWNER_ID:
+        return responses.insufficient_permissions(f"You cannot {verb} someone with a higher or equal role.")
+    return None
+
+def mute_permission(settings):
+    """The permission a moderator needs to mute with the guild's mute backend"""
+    return 'moderate_members' if settings['mute_backend'] == 'timeout' else 'manage_roles'
+
+class ConfirmView(discord.ui.View):
+    """Confirm/cancel buttons only the invoking moderator can press"""
+
+    def __init__(self, author_id, timeout):
+        super().__init__(timeout=timeout)
+        self.author_id = author_id
+        self.confirmed = False
+        self.interaction = None  # The button press, to respond to
+
+    async def interaction_check(self, interaction: discord.Interaction):
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message(embed=responses.error("This isn't your confirmation."), ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="Confirm", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.confirmed = True
+        self.interaction = interaction
+        self.stop()
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.interaction = interaction
+        self.stop()
+
+class MuteRecord:
+    """A role mute applied by this cog"""
+
+    __slots__ = ('role_id', 'muted_at')
+
+    def __init__(self, role_id):
+        self.role_id = role_id
+        self.muted_at = time.time()
+
 class ModerationSlash(commands.Cog):
     """Slash command moderation features"""
     
+    help_section = "🔨 Basic Moderation"
+    
     def __init__(self, bot):
         self.bot = bot
-        self.muted_users = {}  # {user_id: {guild_id: role_id}}
+        self.muted_users = {}  # {guild_id: {user_id: MuteRecord}}
+    
+    async def cog_load(self):
+        self.bot.lifecycle.track(self)
+    
+    async def cog_unload(self):
+        self.bot.lifecycle.untrack(self)
+    
+    def forget_guild(self, guild_id):
+        self.muted_users.pop(guild_id, None)
     
-    async def create_mute_role(self, guild):
+    def forget_member(self, guild_id, user_id):
+        mutes = self.muted_users.get(guild_id)
+        if mutes is not None:
+            mutes.pop(user_id, None)
+            if not mutes:
+                del self.muted_users[guild_id]
+    
+    def compact(self, active_guild_ids):
+        """Drop mute records for guilds the bot left"""
+        stale = [guild_id for guild_id in self.muted_users if guild_id not in active_guild_ids]
+        dropped = 0
+        for guild_id in stale:
+            dropped += len(self.muted_users.pop(guild_id))
+        return dropped
+    
+    async def create_mute_role(self, guild, name="Muted"):
         """Create or find mute role in guild"""
-        mute_role = discord.utils.get(guild.roles, name="Muted")
+        mute_role = discord.utils.get(guild.roles, name=name)
         
         if not mute_role:
             try:
                 mute_role = await guild.create_role(
-                    name="Muted",
+                    name=name,
                     color=discord.Color.dark_grey(),
                     reason="Mute role for moderation"
                 )
@@ -49,36 +128,31 @@ class ModerationSlash(commands.Cog):
                 
         return mute_role
     
+    async def apply_mute(self, member, mute_role, reason):
+        """Mute with the mute role, or with a timeout when mute_role is None"""
+        if mute_role:
+            await member.add_roles(mute_role, reason=reason)
+            
+            # Store mute info
+            self.muted_users.setdefault(member.guild.id, {})[member.id] = MuteRecord(mute_role.id)
+        else:
+            await member.timeout(Config.MUTE_TIMEOUT, reason=reason)
+    
     @discord.app_commands.command(name='ban', description='Ban a user from the server')
     @discord.app_commands.describe(member='The member to ban', reason='Reason for the ban')
     async def ban_user(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided"):
         """Ban a user from the server"""
         # Check permissions
-        author_member = interaction.guild.get_member(interaction.user.id)
-        if not author_member.guild_permissions.ban_members and interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="❌ Missing Permissions",
-                description="You don't have permission to ban members.",
-                color=discord.Color.red()
-            )
+        author_member = interaction.user  # Guild interactions carry the invoking Member
+        settings = self.bot.guild_config.get(interaction.guild.id)
+        if not author_member.guild_permissions.ban_members and interaction.user.id != Config.OWNER_ID \
+                and not is_moderator(author_member, settings):
+            embed = responses.missing_permissions("You don't have permission to ban members.")
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
-        # Owner protection
-        if member.id == Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🛡️ Owner Protection",
-                description="Cannot moderate the bot owner!",
-                color=discord.Color.red()
-            )
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        
-        # Check if target has higher role
-        if member.top_role >= author_member.top_role and interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="❌ Insufficient Permissions",
-                description="You cannot ban someone with a higher or equal role.",
-                color=discord.Color.red()
-            )
+        # Owner protection and role hierarchy
+        embed = target_error(author_member, member, "ban")
+        if embed:
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
@@ -93,14 +167,11 @@ class ModerationSlash(commands.Cog):
             embed.add_field(name="Moderator", value=interaction.user.mention, inline=True)
             
             await interaction.response.send_message(embed=embed)
+            self.bot.modlog.log(interaction.guild, modlog_embed("🔨 Ban", member, interaction.user, reason, discord.Color.red()))
             logger.info(f'{interaction.user} banned {member} in {interaction.guild.name}. Reason: {reason}')
             
         except discord.Forbidden:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="I don't have permission to ban this user.",
-                color=discord.Color.red()
-            )
+            embed = responses.error("I don't have permission to ban this user.")
             await interaction.response.send_message(embed=embed, ephemeral=True)
     
     @discord.app_commands.command(name='kick', description='Kick a user from the server')
@@ -108,31 +179,16 @@ class ModerationSlash(commands.Cog):
     async def kick_user(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided"):
         """Kick a user from the server"""
         # Check permissions
-        author_member = interaction.guild.get_member(interaction.user.id)
-        if not author_member.guild_permissions.kick_members and interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="❌ Missing Permissions",
-                description="You don't have permission to kick members.",
-                color=discord.Color.red()
-            )
+        author_member = interaction.user  # Guild interactions carry the invoking Member
+        settings = self.bot.guild_config.get(interaction.guild.id)
+        if not author_member.guild_permissions.kick_members and interaction.user.id != Config.OWNER_ID \
+                and not is_moderator(author_member, settings):
+            embed = responses.missing_permissions("You don't have permission to kick members.")
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
-        # Owner protection
-        if member.id == Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🛡️ Owner Protection",
-                description="Cannot moderate the bot owner!",
-                color=discord.Color.red()
-            )
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        
-        # Check if target has higher role
-        if member.top_role >= author_member.top_role and interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="❌ Insufficient Permissions",
-                description="You cannot kick someone with a higher or equal role.",
-                color=discord.Color.red()
-            )
+        # Owner protection and role hierarchy
+        embed = target_error(author_member, member, "kick")
+        if embed:
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
@@ -147,14 +203,11 @@ class ModerationSlash(commands.Cog):
             embed.add_field(name="Moderator", value=interaction.user.mention, inline=True)
             
             await interaction.response.send_message(embed=embed)
+            self.bot.modlog.log(interaction.guild, modlog_embed("👢 Kick", member, interaction.user, reason, discord.Color.orange()))
             logger.info(f'{interaction.user} kicked {member} in {interaction.guild.name}. Reason: {reason}')
             
         except discord.Forbidden:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="I don't have permission to kick this user.",
-                color=discord.Color.red()
-            )
+            embed = responses.error("I don't have permission to kick this user.")
             await interaction.response.send_message(embed=embed, ephemeral=True)
     
     @discord.app_commands.command(name='mute', description='Mute a user in the server')
@@ -162,57 +215,34 @@ class ModerationSlash(commands.Cog):
     async def mute_user(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided"):
         """Mute a user in the server"""
         # Check permissions
-        author_member = interaction.guild.get_member(interaction.user.id)
-        if not author_member.guild_permissions.manage_roles and interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="❌ Missing Permissions",
-                description="You don't have permission to manage roles.",
-                color=discord.Color.red()
-            )
+        author_member = interaction.user  # Guild interactions carry the invoking Member
+        settings = self.bot.guild_config.get(interaction.guild.id)
+        if not getattr(author_member.guild_permissions, mute_permission(settings)) and interaction.user.id != Config.OWNER_ID \
+                and not is_moderator(author_member, settings):
+            embed = responses.missing_permissions("You don't have permission to mute members.")
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
-        # Owner protection
-        if member.id == Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🛡️ Owner Protection",
-                description="Cannot moderate the bot owner!",
-                color=discord.Color.red()
-            )
+        # Owner protection and role hierarchy
+        embed = target_error(author_member, member, "mute")
+        if embed:
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
-        # Check if target has higher role
-        if member.top_role >= author_member.top_role and interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="❌ Insufficient Permissions",
-                description="You cannot mute someone with a higher or equal role.",
-                color=discord.Color.red()
-            )
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
-        
-        mute_role = await self.create_mute_role(interaction.guild)
-        if not mute_role:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="I don't have permission to create or manage the mute role.",
-                color=discord.Color.red()
-            )
-            return await interaction.response.send_message(embed=embed, ephemeral=True)
+        if settings['mute_backend'] == 'timeout':
+            mute_role = None
+            already_muted = member.is_timed_out()
+        else:
+            mute_role = await self.create_mute_role(interaction.guild, settings['mute_role'])
+            if not mute_role:
+                embed = responses.error("I don't have permission to create or manage the mute role.")
+                return await interaction.response.send_message(embed=embed, ephemeral=True)
+            already_muted = mute_role in member.roles
         
-        if mute_role in member.roles:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="This user is already muted.",
-                color=discord.Color.red()
-            )
+        if already_muted:
+            embed = responses.error("This user is already muted.")
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
-            await member.add_roles(mute_role, reason=reason)
-            
-            # Store mute info
-            if member.id not in self.muted_users:
-                self.muted_users[member.id] = {}
-            self.muted_users[member.id][interaction.guild.id] = mute_role.id
+            await self.apply_mute(member, mute_role, reason)
             
             embed = discord.Embed(
                 title="🔇 User Muted",
@@ -223,14 +253,11 @@ class ModerationSlash(commands.Cog):
             embed.add_field(name="Moderator", value=interaction.user.mention, inline=True)
             
             await interaction.response.send_message(embed=embed)
+            self.bot.modlog.log(interaction.guild, modlog_embed("🔇 Mute", member, interaction.user, reason))
             logger.info(f'{interaction.user} muted {member} in {interaction.guild.name}. Reason: {reason}')
             
         except discord.Forbidden:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="I don't have permission to mute this user.",
-                color=discord.Color.red()
-            )
+            embed = responses.error("I don't have permission to mute this user.")
             await interaction.response.send_message(embed=embed, ephemeral=True)
     
     @discord.app_commands.command(name='unmute', description='Unmute a user in the server')
@@ -238,32 +265,30 @@ class ModerationSlash(commands.Cog):
     async def unmute_user(self, interaction: discord.Interaction, member: discord.Member):
         """Unmute a user in the server"""
         # Check permissions
-        author_member = interaction.guild.get_member(interaction.user.id)
-        if not author_member.guild_permissions.manage_roles and interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="❌ Missing Permissions",
-                description="You don't have permission to manage roles.",
-                color=discord.Color.red()
-            )
+        author_member = interaction.user  # Guild interactions carry the invoking Member
+        settings = self.bot.guild_config.get(interaction.guild.id)
+        if not getattr(author_member.guild_permissions, mute_permission(settings)) and interaction.user.id != Config.OWNER_ID \
+                and not is_moderator(author_member, settings):
+            embed = responses.missing_permissions("You don't have permission to unmute members.")
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
-        mute_role = discord.utils.get(interaction.guild.roles, name="Muted")
-        if not mute_role or mute_role not in member.roles:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="This user is not muted.",
-                color=discord.Color.red()
-            )
+        # Check both backends, a mute from before the backend was switched uses the other one
+        mute_role = discord.utils.get(interaction.guild.roles, name=settings['mute_role'])
+        role_muted = mute_role is not None and mute_role in member.roles
+        timed_out = member.is_timed_out()
+        
+        if not (role_muted or timed_out):
+            embed = responses.error("This user is not muted.")
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
-            await member.remove_roles(mute_role, reason="Unmuted by moderator")
+            if role_muted:
+                await member.remove_roles(mute_role, reason="Unmuted by moderator")
+            if timed_out:
+                await member.timeout(None, reason="Unmuted by moderator")
             
             # Remove from mute tracking
-            if member.id in self.muted_users and interaction.guild.id in self.muted_users[member.id]:
-                del self.muted_users[member.id][interaction.guild.id]
-                if not self.muted_users[member.id]:
-                    del self.muted_users[member.id]
+            self.forget_member(interaction.guild.id, member.id)
             
             embed = discord.Embed(
                 title="🔊 User Unmuted",
@@ -273,15 +298,177 @@ class ModerationSlash(commands.Cog):
             embed.add_field(name="Moderator", value=interaction.user.mention, inline=True)
             
             await interaction.response.send_message(embed=embed)
+            self.bot.modlog.log(interaction.guild, modlog_embed("🔊 Unmute", member, interaction.user, color=discord.Color.green()))
             logger.info(f'{interaction.user} unmuted {member} in {interaction.guild.name}')
             
         except discord.Forbidden:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="I don't have permission to unmute this user.",
-                color=discord.Color.red()
-            )
+            embed = responses.error("I don't have permission to unmute this user.")
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    async def role_members(self, guild, role):
+        """Every member holding the role, or None if they can't be listed"""
+        if guild.chunked:
+            return list(role.members)
+        if not self.bot.intents.members:
+            return None
+        # Paginated REST listing, 1000 members per request
+        return [member async for member in guild.fetch_members(limit=None) if member.get_role(role.id)]
+
+    @app_commands.command(name='roleaction', description='Mute or kick every member holding a role')
+    @app_commands.describe(role='Members holding this role are affected', action='What to do with them', reason='Reason for the action')
+    @app_commands.choices(action=[
+        app_commands.Choice(name='Mute', value='mute'),
+        app_commands.Choice(name='Kick', value='kick'),
+    ])
+    async def role_action(self, interaction: discord.Interaction, role: discord.Role, action: app_commands.Choice[str],
+                          reason: str = "No reason provided"):
+        """Mute or kick every member holding a role"""
+        # Check permissions
+        author_member = interaction.user  # Guild interactions carry the invoking Member
+        guild = interaction.guild
+        settings = self.bot.guild_config.get(guild.id)
+        permission = 'kick_members' if action.value == 'kick' else mute_permission(settings)
+        if not getattr(author_member.guild_permissions, permission) and interaction.user.id != Config.OWNER_ID \
+                and not is_moderator(author_member, settings):
+            embed = responses.missing_permissions(f"You don't have permission to {action.value} members.")
+            return await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        if role.is_default():
+            embed = responses.error("Pick a specific role, not @everyone.")
+            return await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        members = await self.role_members(guild, role)
+        if members is None:
+            embed = responses.error("Listing role members needs the server members intent (MEMBERS_INTENT=1).")
+            return await interaction.followup.send(embed=embed, ephemeral=True)
+
+        # Same checks as the single-member commands; members done by an interrupted run are skipped
+        done = await self.bot.bulk_checkpoints.done(guild.id, role.id, action.value)
+        targets = []
+        protected = 0
+        for member in members:
+            if member.id in done:
+                continue
+            if member.id in (self.bot.user.id, author_member.id) or target_error(author_member, member, action.value):
+                protected += 1
+            else:
+                targets.append(member)
+
+        if not targets:
+            embed = responses.error(f"Nobody holding {role.mention} can be {action.value}d by you.")
+            return await interaction.followup.send(embed=embed, ephemeral=True)
+
+        # Preview the count before touching anyone
+        embed = discord.Embed(
+            title=f"⚠️ {action.name} everyone with {role.name}?",
+            description=f"**{len(targets)}** members will be {action.value}d.",
+            color=discord.Color.orange()
+        )
+        embed.add_field(name="Reason", value=reason, inline=False)
+        if protected:
+            embed.add_field(name="Skipped", value=f"{protected} members (role hierarchy or protected)", inline=True)
+        if done:
+            embed.add_field(name="Resuming", value=f"{len(done)} members already handled by an earlier run", inline=True)
+        view = ConfirmView(author_member.id, Config.BULK_CONFIRM_TIMEOUT)
+        await interaction.followup.send(embed=embed, view=view, ephemeral=True)
+
+        if await view.wait() or not view.confirmed:
+            embed = responses.error("Nobody was affected.", "🚫 Cancelled")
+            if view.interaction:
+                return await view.interaction.response.edit_message(embed=embed, view=None)
+            return await interaction.edit_original_response(embed=embed, view=None)
+
+        mute_role = None
+        if action.value == 'mute' and settings['mute_backend'] != 'timeout':
+            mute_role = await self.create_mute_role(guild, settings['mute_role'])
+            if not mute_role:
+                embed = responses.error("I don't have permission to create or manage the mute role.")
+                return await view.interaction.response.edit_message(embed=embed, view=None)
+
+        embed = discord.Embed(
+            title=f"⏳ Role {action.name} Running",
+            description=f"0/{len(targets)} members handled.",
+            color=discord.Color.orange()
+        )
+        await view.interaction.response.edit_message(embed=embed, view=None)
+
+        succeeded, failed = await self.run_role_action(interaction, role, action.value, targets, mute_role, reason)
+
+        embed = discord.Embed(
+            title=f"🧹 Role {action.name} Finished",
+            description=f"Members holding {role.mention}:",
+            color=discord.Color.orange() if failed else discord.Color.green()
+        )
+        embed.add_field(name=f"{action.name}d", value=str(succeeded), inline=True)
+        embed.add_field(name="Failed", value=str(failed), inline=True)
+        if failed:
+            embed.set_footer(text="Run the command again to retry the failed members")
+        try:
+            await interaction.edit_original_response(embed=embed)
+        except discord.HTTPException:
+            # Interaction tokens expire after 15 minutes
+            try:
+                await interaction.channel.send(embed=embed)
+            except discord.HTTPException as e:
+                logger.warning(f'Could not post the role {action.value} summary in {guild.name}: {e}')
+
+        summary = modlog_embed(f"🧹 Role {action.name}", role, interaction.user, reason, discord.Color.orange())
+        summary.add_field(name="Members", value=f"{succeeded} {action.value}d, {failed} failed", inline=True)
+        self.bot.modlog.log(guild, summary)
+        logger.info(f'{interaction.user} {action.value}d {succeeded} members with {role.name} in {guild.name} '
+                    f'({failed} failed). Reason: {reason}')
+
+    async def run_role_action(self, interaction, role, action, targets, mute_role, reason):
+        """Act on the targets with bounded concurrency, checkpointing progress; returns (succeeded, failed)"""
+        guild = interaction.guild
+        checkpoints = self.bot.bulk_checkpoints
+        semaphore = asyncio.Semaphore(Config.BULK_ACTION_CONCURRENCY)
+        handled = []  # User IDs not yet written to the checkpoint
+        succeeded = failed = 0
+        next_update = time.monotonic() + Config.BULK_PROGRESS_SECONDS
+
+        async def act(member):
+            nonlocal handled, succeeded, failed, next_update
+            async with semaphore:
+                try:
+                    if action == 'kick':
+                        await member.kick(reason=reason)
+                    elif not ((mute_role in member.roles) if mute_role else member.is_timed_out()):
+                        await self.apply_mute(member, mute_role, reason)
+                except discord.HTTPException as e:
+                    failed += 1
+                    logger.warning(f'Role {action} failed for {member} in {guild.name}: {e}')
+                    return
+
+            succeeded += 1
+            self.bot.members.invalidate(guild.id, member.id)
+            handled.append(member.id)
+            if len(handled) >= Config.BULK_CHECKPOINT_EVERY:
+                batch, handled = handled, []
+                await checkpoints.record(guild.id, role.id, action, batch)
+
+            if time.monotonic() >= next_update:
+                next_update = time.monotonic() + Config.BULK_PROGRESS_SECONDS
+                embed = discord.Embed(
+                    title=f"⏳ Role {action.capitalize()} Running",
+                    description=f"{succeeded + failed}/{len(targets)} members handled.",
+                    color=discord.Color.orange()
+                )
+                try:
+                    await interaction.edit_original_response(embed=embed)
+                except discord.HTTPException:
+                    pass
+
+        await asyncio.gather(*(act(member) for member in targets))
+
+        if failed:
+            # Keep the checkpoint so a second run only retries the failures
+            await checkpoints.record(guild.id, role.id, action, handled)
+        else:
+            await checkpoints.clear(guild.id, role.id, action)
+        return succeeded, failed
+
 async def setup(bot):
     await bot.add_cog(ModerationSlash(bot))
@@ -2,6 +2,9 @@ import discord
 from discord.ext import commands
 import asyncio
 from utils.logger import setup_logger
+from utils import responses
+from utils.modlog import modlog_embed
+from utils.ban_list import GLOBAL_BAN_REASON, is_global_ban
 from config import Config
 
 logger = setup_logger()
@@ -9,6 +12,9 @@ logger = setup_logger()
 class OwnerSlash(commands.Cog):
     """Owner-only slash commands with global moderation capabilities"""
     
+    help_section = "👑 Owner Commands"
+    owner_only = True
+    
     def __init__(self, bot):
         self.bot = bot
     
@@ -18,59 +24,46 @@ class OwnerSlash(commands.Cog):
         """Ban a user from all servers the bot is in"""
         # Owner check
         if interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🔒 Access Denied",
-                description="Only the bot owner can use this command.",
-                color=discord.Color.red()
-            )
+            embed = responses.ACCESS_DENIED
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
             user_id_int = int(user_id)
         except ValueError:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Please provide a valid user ID.",
-                color=discord.Color.red()
-            )
+            embed = responses.INVALID_USER_ID
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         # Owner protection
         if user_id_int == Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🛡️ Owner Protection",
-                description="Cannot ban the bot owner!",
-                color=discord.Color.red()
-            )
+            embed = responses.owner_protection("Cannot ban the bot owner!")
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
             user = await self.bot.fetch_user(user_id_int)
         except discord.NotFound:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="User not found.",
-                color=discord.Color.red()
-            )
+            embed = responses.USER_NOT_FOUND
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         await interaction.response.defer()
         
-        banned_guilds = []
-        failed_guilds = []
+        summary = responses.ResultSummary()
         
         for guild in self.bot.guilds:
             try:
-                member = guild.get_member(user_id_int)
-                if member:
-                    await member.ban(reason=f"Global ban by owner: {reason}")
-                    banned_guilds.append(guild.name)
-                    logger.info(f'Global ban: {user} banned from {guild.name}')
+                # Ban by ID so servers the user isn't in yet are covered right away
+                await guild.ban(user, reason=f"{GLOBAL_BAN_REASON} by owner: {reason}")
+                summary.success(guild.name)
+                self.bot.modlog.log(guild, modlog_embed("🌍 Global Ban", user, interaction.user, reason, discord.Color.red()))
+                self.bot.members.invalidate(guild.id, user_id_int)
+                logger.info(f'Global ban: {user} banned from {guild.name}')
             except discord.Forbidden:
-                failed_guilds.append(guild.name)
+                summary.failure(guild.name)
             except Exception as e:
                 logger.error(f'Error banning {user} from {guild.name}: {e}')
-                failed_guilds.append(guild.name)
+                summary.failure(guild.name)
+        
+        # Record the ban so servers joined later apply it too
+        await self.bot.ban_list.add(user_id_int, reason)
         
         embed = discord.Embed(
             title="🌍 Global Ban Executed",
@@ -78,22 +71,8 @@ class OwnerSlash(commands.Cog):
             color=discord.Color.red()
         )
         embed.add_field(name="Reason", value=reason, inline=False)
-        embed.add_field(name="Banned from", value=f"{len(banned_guilds)} servers", inline=True)
-        embed.add_field(name="Failed", value=f"{len(failed_guilds)} servers", inline=True)
-        
-        if banned_guilds:
-            embed.add_field(
-                name="Success",
-                value="\n".join(banned_guilds[:10]) + ("..." if len(banned_guilds) > 10 else ""),
-                inline=False
-            )
-        
-        if failed_guilds:
-            embed.add_field(
-                name="Failed Servers",
-                value="\n".join(failed_guilds[:10]) + ("..." if len(failed_guilds) > 10 else ""),
-                inline=False
-            )
+        embed.add_field(name="Ban List", value="Added to the global ban list", inline=False)
+        summary.render(embed, "Banned from")
         
         await interaction.followup.send(embed=embed)
         logger.info(f'{interaction.user} executed global ban on {user}. Reason: {reason}')
@@ -104,59 +83,44 @@ class OwnerSlash(commands.Cog):
         """Kick a user from all servers the bot is in"""
         # Owner check
         if interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🔒 Access Denied",
-                description="Only the bot owner can use this command.",
-                color=discord.Color.red()
-            )
+            embed = responses.ACCESS_DENIED
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
             user_id_int = int(user_id)
         except ValueError:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Please provide a valid user ID.",
-                color=discord.Color.red()
-            )
+            embed = responses.INVALID_USER_ID
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         # Owner protection
         if user_id_int == Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🛡️ Owner Protection",
-                description="Cannot kick the bot owner!",
-                color=discord.Color.red()
-            )
+            embed = responses.owner_protection("Cannot kick the bot owner!")
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
             user = await self.bot.fetch_user(user_id_int)
         except discord.NotFound:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="User not found.",
-                color=discord.Color.red()
-            )
+            embed = responses.USER_NOT_FOUND
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         await interaction.response.defer()
         
-        kicked_guilds = []
-        failed_guilds = []
+        summary = responses.ResultSummary()
         
         for guild in self.bot.guilds:
             try:
-                member = guild.get_member(user_id_int)
+                member = await self.bot.members.resolve(guild, user_id_int)
                 if member:
                     await member.kick(reason=f"Global kick by owner: {reason}")
-                    kicked_guilds.append(guild.name)
+                    summary.success(guild.name)
+                    self.bot.modlog.log(guild, modlog_embed("🌍 Global Kick", user, interaction.user, reason, discord.Color.orange()))
+                    self.bot.members.invalidate(guild.id, user_id_int)
                     logger.info(f'Global kick: {user} kicked from {guild.name}')
             except discord.Forbidden:
-                failed_guilds.append(guild.name)
+                summary.failure(guild.name)
             except Exception as e:
                 logger.error(f'Error kicking {user} from {guild.name}: {e}')
-                failed_guilds.append(guild.name)
+                summary.failure(guild.name)
         
         embed = discord.Embed(
             title="🌍 Global Kick Executed",
@@ -164,22 +128,7 @@ class OwnerSlash(commands.Cog):
             color=discord.Color.orange()
         )
         embed.add_field(name="Reason", value=reason, inline=False)
-        embed.add_field(name="Kicked from", value=f"{len(kicked_guilds)} servers", inline=True)
-        embed.add_field(name="Failed", value=f"{len(failed_guilds)} servers", inline=True)
-        
-        if kicked_guilds:
-            embed.add_field(
-                name="Success",
-                value="\n".join(kicked_guilds[:10]) + ("..." if len(kicked_guilds) > 10 else ""),
-                inline=False
-            )
-        
-        if failed_guilds:
-            embed.add_field(
-                name="Failed Servers",
-                value="\n".join(failed_guilds[:10]) + ("..." if len(failed_guilds) > 10 else ""),
-                inline=False
-            )
+        summary.render(embed, "Kicked from")
         
         await interaction.followup.send(embed=embed)
         logger.info(f'{interaction.user} executed global kick on {user}. Reason: {reason}')
@@ -190,57 +139,50 @@ class OwnerSlash(commands.Cog):
         """Mute a user in all servers the bot is in"""
         # Owner check
         if interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🔒 Access Denied",
-                description="Only the bot owner can use this command.",
-                color=discord.Color.red()
-            )
+            embed = responses.ACCESS_DENIED
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
             user_id_int = int(user_id)
         except ValueError:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Please provide a valid user ID.",
-                color=discord.Color.red()
-            )
+            embed = responses.INVALID_USER_ID
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         # Owner protection
         if user_id_int == Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🛡️ Owner Protection",
-                description="Cannot mute the bot owner!",
-                color=discord.Color.red()
-            )
+            embed = responses.owner_protection("Cannot mute the bot owner!")
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
             user = await self.bot.fetch_user(user_id_int)
         except discord.NotFound:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="User not found.",
-                color=discord.Color.red()
-            )
+            embed = responses.USER_NOT_FOUND
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         await interaction.response.defer()
         
-        muted_guilds = []
-        failed_guilds = []
+        summary = responses.ResultSummary()
         
         for guild in self.bot.guilds:
             try:
-                member = guild.get_member(user_id_int)
+                member = await self.bot.members.resolve(guild, user_id_int, fresh=True)
                 if member:
+                    settings = self.bot.guild_config.get(guild.id)
+                    if settings['mute_backend'] == 'timeout':
+                        if not member.is_timed_out():
+                            await member.timeout(Config.MUTE_TIMEOUT, reason=f"Global mute by owner: {reason}")
+                            summary.success(guild.name)
+                            self.bot.modlog.log(guild, modlog_embed("🌍 Global Mute", user, interaction.user, reason))
+                            self.bot.members.invalidate(guild.id, user_id_int)
+                            logger.info(f'Global mute: {user} timed out in {guild.name}')
+                        continue
+                    
                     # Get or create mute role
-                    mute_role = discord.utils.get(guild.roles, name="Muted")
+                    mute_role = discord.utils.get(guild.roles, name=settings['mute_role'])
                     if not mute_role:
                         try:
                             mute_role = await guild.create_role(
-                                name="Muted",
+                                name=settings['mute_role'],
                                 color=discord.Color.dark_grey(),
                                 reason="Mute role for moderation"
                             )
@@ -264,18 +206,20 @@ class OwnerSlash(commands.Cog):
                                 except discord.Forbidden:
                                     continue
                         except discord.Forbidden:
-                            failed_guilds.append(guild.name)
+                            summary.failure(guild.name)
                             continue
                     
                     if mute_role not in member.roles:
                         await member.add_roles(mute_role, reason=f"Global mute by owner: {reason}")
-                        muted_guilds.append(guild.name)
+                        summary.success(guild.name)
+                        self.bot.modlog.log(guild, modlog_embed("🌍 Global Mute", user, interaction.user, reason))
+                        self.bot.members.invalidate(guild.id, user_id_int)
                         logger.info(f'Global mute: {user} muted in {guild.name}')
             except discord.Forbidden:
-                failed_guilds.append(guild.name)
+                summary.failure(guild.name)
             except Exception as e:
                 logger.error(f'Error muting {user} in {guild.name}: {e}')
-                failed_guilds.append(guild.name)
+                summary.failure(guild.name)
         
         embed = discord.Embed(
             title="🌍 Global Mute Executed",
@@ -283,22 +227,7 @@ class OwnerSlash(commands.Cog):
             color=discord.Color.dark_grey()
         )
         embed.add_field(name="Reason", value=reason, inline=False)
-        embed.add_field(name="Muted in", value=f"{len(muted_guilds)} servers", inline=True)
-        embed.add_field(name="Failed", value=f"{len(failed_guilds)} servers", inline=True)
-        
-        if muted_guilds:
-            embed.add_field(
-                name="Success",
-                value="\n".join(muted_guilds[:10]) + ("..." if len(muted_guilds) > 10 else ""),
-                inline=False
-            )
-        
-        if failed_guilds:
-            embed.add_field(
-                name="Failed Servers",
-                value="\n".join(failed_guilds[:10]) + ("..." if len(failed_guilds) > 10 else ""),
-                inline=False
-            )
+        summary.render(embed, "Muted in")
         
         await interaction.followup.send(embed=embed)
         logger.info(f'{interaction.user} executed global mute on {user}. Reason: {reason}')
@@ -309,88 +238,119 @@ class OwnerSlash(commands.Cog):
         """Unmute a user from all servers the bot is in"""
         # Owner check
         if interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🔒 Access Denied",
-                description="Only the bot owner can use this command.",
-                color=discord.Color.red()
-            )
+            embed = responses.ACCESS_DENIED
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
             user_id_int = int(user_id)
         except ValueError:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Please provide a valid user ID.",
-                color=discord.Color.red()
-            )
+            embed = responses.INVALID_USER_ID
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
             user = await self.bot.fetch_user(user_id_int)
         except discord.NotFound:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="User not found.",
-                color=discord.Color.red()
-            )
+            embed = responses.USER_NOT_FOUND
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         await interaction.response.defer()
         
-        unmuted_guilds = []
-        failed_guilds = []
+        summary = responses.ResultSummary()
         
         for guild in self.bot.guilds:
             try:
-                member = guild.get_member(user_id_int)
+                member = await self.bot.members.resolve(guild, user_id_int, fresh=True)
                 if member:
-                    mute_role = discord.utils.get(guild.roles, name="Muted")
-                    if mute_role and mute_role in member.roles:
-                        await member.remove_roles(mute_role, reason="Global unmute by owner")
-                        unmuted_guilds.append(guild.name)
+                    settings = self.bot.guild_config.get(guild.id)
+                    # Check both backends, a mute from before the backend was switched uses the other one
+                    mute_role = discord.utils.get(guild.roles, name=settings['mute_role'])
+                    role_muted = mute_role is not None and mute_role in member.roles
+                    timed_out = member.is_timed_out()
+                    if role_muted or timed_out:
+                        if role_muted:
+                            await member.remove_roles(mute_role, reason="Global unmute by owner")
+                        if timed_out:
+                            await member.timeout(None, reason="Global unmute by owner")
+                        summary.success(guild.name)
+                        self.bot.modlog.log(guild, modlog_embed("🌍 Global Unmute", user, interaction.user, color=discord.Color.green()))
+                        self.bot.members.invalidate(guild.id, user_id_int)
                         logger.info(f'Global unmute: {user} unmuted in {guild.name}')
             except discord.Forbidden:
-                failed_guilds.append(guild.name)
+                summary.failure(guild.name)
             except Exception as e:
                 logger.error(f'Error unmuting {user} in {guild.name}: {e}')
-                failed_guilds.append(guild.name)
+                summary.failure(guild.name)
         
         embed = discord.Embed(
             title="🌍 Global Unmute Executed",
             description=f"**{user}** has been globally unmuted.",
             color=discord.Color.green()
         )
-        embed.add_field(name="Unmuted in", value=f"{len(unmuted_guilds)} servers", inline=True)
-        embed.add_field(name="Failed", value=f"{len(failed_guilds)} servers", inline=True)
+        summary.render(embed, "Unmuted in")
         
-        if unmuted_guilds:
-            embed.add_field(
-                name="Success",
-                value="\n".join(unmuted_guilds[:10]) + ("..." if len(unmuted_guilds) > 10 else ""),
-                inline=False
-            )
+        await interaction.followup.send(embed=embed)
+        logger.info(f'{interaction.user} executed global unmute on {user}')
+    
+    @discord.app_commands.command(name='globalunban', description='Remove a user from the global ban list and unban them everywhere')
+    @discord.app_commands.describe(user_id='The user ID to globally unban')
+    async def global_unban(self, interaction: discord.Interaction, user_id: str):
+        """Remove a user from the global ban list and unban them from all servers"""
+        # Owner check
+        if interaction.user.id != Config.OWNER_ID:
+            embed = responses.ACCESS_DENIED
+            return await interaction.response.send_message(embed=embed, ephemeral=True)
         
-        if failed_guilds:
-            embed.add_field(
-                name="Failed Servers",
-                value="\n".join(failed_guilds[:10]) + ("..." if len(failed_guilds) > 10 else ""),
-                inline=False
-            )
+        try:
+            user_id_int = int(user_id)
+        except ValueError:
+            embed = responses.INVALID_USER_ID
+            return await interaction.response.send_message(embed=embed, ephemeral=True)
+        
+        await interaction.response.defer()
+        
+        # Remove from the list first so the next sync doesn't re-apply the ban
+        listed = await self.bot.ban_list.remove(user_id_int)
+        
+        summary = responses.ResultSummary()
+        kept = 0
+        user_object = discord.Object(id=user_id_int)
+        
+        for guild in self.bot.guilds:
+            try:
+                # Only lift bans the bot placed; bans from the server's own moderators stay
+                ban = await guild.fetch_ban(user_object)
+                if not is_global_ban(ban.reason):
+                    kept += 1
+                    continue
+                await guild.unban(user_object, reason="Global unban by owner")
+                summary.success(guild.name)
+            except discord.NotFound:
+                continue
+            except discord.Forbidden:
+                summary.failure(guild.name)
+            except Exception as e:
+                logger.error(f'Error unbanning {user_id_int} from {guild.name}: {e}')
+                summary.failure(guild.name)
+        
+        embed = discord.Embed(
+            title="🌍 Global Unban Executed",
+            description=f"User `{user_id_int}` has been globally unbanned.",
+            color=discord.Color.green()
+        )
+        embed.add_field(name="Ban List", value="Removed" if listed else "Was not listed", inline=True)
+        if kept:
+            embed.add_field(name="Kept", value=f"{kept} servers banned them independently", inline=True)
+        summary.render(embed, "Unbanned in")
         
         await interaction.followup.send(embed=embed)
-        logger.info(f'{interaction.user} executed global unmute on {user}')
+        logger.info(f'{interaction.user} executed global unban on {user_id_int}')
     
     @discord.app_commands.command(name='servers', description='List all servers the bot is in')
     async def list_servers(self, interaction: discord.Interaction):
         """List all servers the bot is in"""
         # Owner check
         if interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🔒 Access Denied",
-                description="Only the bot owner can use this command.",
-                color=discord.Color.red()
-            )
+            embed = responses.ACCESS_DENIED
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         if not self.bot.guilds:
@@ -401,30 +361,57 @@ class OwnerSlash(commands.Cog):
             )
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
-        servers_info = []
-        for guild in self.bot.guilds:
-            servers_info.append(f"**{guild.name}** (ID: {guild.id}) - {guild.member_count} members")
+        # Format one page at a time instead of building every line up front
+        server_lines = (
+            f"**{guild.name}** (ID: {guild.id}) - {guild.member_count} members"
+            for guild in self.bot.guilds
+        )
         
-        # Split into chunks if too many servers
-        chunk_size = 20
-        server_chunks = [servers_info[i:i + chunk_size] for i in range(0, len(servers_info), chunk_size)]
+        for i, chunk in enumerate(responses.pages(server_lines, per_page=20)):
+            if i == 0:
+                embed = discord.Embed(
+                    title="📊 Server List",
+                    description=f"Bot is in **{len(self.bot.guilds)}** servers total\n\n" + "\n".join(chunk),
+                    color=discord.Color.blue()
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+            else:
+                embed = discord.Embed(
+                    title=f"📊 Server List (Page {i+1})",
+                    description="\n".join(chunk),
+                    color=discord.Color.blue()
+                )
+                await interaction.followup.send(embed=embed, ephemeral=True)
+    
+    @discord.app_commands.command(name='looplag', description='Show event loop lag and recent stalls')
+    async def loop_lag(self, interaction: discord.Interaction):
+        """Show event loop lag and recent stalls"""
+        # Owner check
+        if interaction.user.id != Config.OWNER_ID:
+            embed = responses.ACCESS_DENIED
+            return await interaction.response.send_message(embed=embed, ephemeral=True)
         
+        stats = self.bot.watchdog.stats()
         embed = discord.Embed(
-            title="📊 Server List",
-            description=f"Bot is in **{len(self.bot.guilds)}** servers total\n\n" + "\n".join(server_chunks[0]),
+            title="⏱️ Event Loop Lag",
+            description=f"Current: **{stats['current'] * 1000:.1f} ms**\n"
+                        f"p50: {stats['p50'] * 1000:.1f} ms\n"
+                        f"p95: {stats['p95'] * 1000:.1f} ms\n"
+                        f"Max: {stats['max'] * 1000:.1f} ms\n"
+                        f"Stalls over {self.bot.watchdog.threshold * 1000:.0f} ms: {stats['stalls']}",
             color=discord.Color.blue()
         )
+        embed.add_field(name="Gateway Latency", value=f"{self.bot.latency * 1000:.1f} ms", inline=True)
         
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        
-        # Send additional chunks if needed
-        for i, chunk in enumerate(server_chunks[1:], 1):
-            embed = discord.Embed(
-                title=f"📊 Server List (Page {i+1})",
-                description="\n".join(chunk),
-                color=discord.Color.blue()
+        # Innermost frames of the most recent stalls, newest first
+        for timestamp, stalled, stack in list(self.bot.watchdog.slow_callbacks)[::-1][:3]:
+            embed.add_field(
+                name=f"Stall of {stalled:.2f}s+",
+                value=f"<t:{int(timestamp)}:T>\n```{stack[-950:]}```",
+                inline=False
             )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
     
     @discord.app_commands.command(name='leaveserver', description='Leave a specific server')
     @discord.app_commands.describe(server_id='The server ID to leave')
@@ -432,36 +419,58 @@ class OwnerSlash(commands.Cog):
         """Leave a specific server"""
         # Owner check
         if interaction.user.id != Config.OWNER_ID:
-            embed = discord.Embed(
-                title="🔒 Access Denied",
-                description="Only the bot owner can use this command.",
-                color=discord.Color.red()
-            )
+            embed = responses.ACCESS_DENIED
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
             server_id_int = int(server_id)
         except ValueError:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Please provide a valid server ID.",
-                color=discord.Color.red()
-            )
+            embed = responses.INVALID_SERVER_ID
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         guild = self.bot.get_guild(server_id_int)
         if not guild:
-            embed = discord.Embed(
-                title="❌ Error",
-                description="Bot is not in that server or server not found.",
-                color=discord.Color.red()
-            )
+            embed = responses.error("Bot is not in that server or server not found.")
             return await interaction.response.send_message(embed=embed, ephemeral=True)
         
         guild_name = guild.name
         
         try:
             await guild.leave()
+            # Don't wait for the gateway's GUILD_DELETE to release the guild's state
+            self.bot.lifecycle.forget_guild(server_id_int)
             embed = discord.Embed(
                 title="🚪 Left Server",
-                description=f"Success
+                description=f"Successfully left **{guild_name}** (ID: {server_id_int})",
+                color=discord.Color.green()
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            logger.info(f'{interaction.user} made the bot leave {guild_name} ({server_id_int})')
+        except Exception as e:
+            logger.error(f'Failed to leave {guild_name}: {e}')
+            embed = discord.Embed(
+                title="❌ Error",
+                description=f"Failed to leave **{guild_name}**.",
+                color=discord.Color.red()
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    @discord.app_commands.command(name='shutdown', description='Shutdown the bot')
+    async def shutdown(self, interaction: discord.Interaction):
+        """Shutdown the bot"""
+        # Owner check
+        if interaction.user.id != Config.OWNER_ID:
+            embed = responses.ACCESS_DENIED
+            return await interaction.response.send_message(embed=embed, ephemeral=True)
+        
+        embed = discord.Embed(
+            title="🔌 Shutting Down",
+            description="Bot is shutting down...",
+            color=discord.Color.red()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        logger.info(f'Shutdown initiated by {interaction.user}')
+        await self.bot.close()
+
+async def setup(bot):
+    await bot.add_cog(OwnerSlash(bot))
@@ -1,4 +1,5 @@
 import os
+from datetime import timedelta
 
 class Config:
     """Configuration settings for the Discord bot"""
@@ -16,6 +17,61 @@ class Config:
     BOT_NAME = "Multi-Purpose Bot"
     BOT_VERSION = "1.0.0"
     
+    # Cogs loaded before connecting to the gateway. All of them import and set up
+    # in a few milliseconds (see STARTUP_PROFILE), so none are deferred; heavy
+    # state such as the global ban list is loaded on first use instead.
+    COGS = ['cogs.config_slash', 'cogs.moderation_slash', 'cogs.owner_slash', 'cogs.ban_federation']
+    
+    # Local database for persistent state
+    DATABASE_PATH = os.getenv('DATABASE_PATH', 'bot.db')
+    
+    # Member lookups: the privileged members intent is off unless MEMBERS_INTENT=1,
+    # and even then only the guilds in HOT_GUILD_IDS are chunked
+    MEMBERS_INTENT = os.getenv('MEMBERS_INTENT', '0') == '1'
+    HOT_GUILD_IDS = [int(guild_id) for guild_id in os.getenv('HOT_GUILD_IDS', '').split(',') if guild_id.strip()]
+    MEMBER_CACHE_SIZE = 256  # Resolved members kept per guild
+    MEMBER_CACHE_TTL = 300  # Seconds before a resolved member is looked up again
+    
+    # Per-guild settings are re-read from the database this often
+    GUILD_CONFIG_RELOAD_SECONDS = 60
+    
+    # Minutes between sweeps that drop state for guilds the bot has left
+    STATE_COMPACT_MINUTES = 30
+    
+    # Length of a mute when a guild uses the timeout backend: Discord's 28 day
+    # maximum, less a margin so a slightly fast host clock isn't rejected
+    MUTE_TIMEOUT = timedelta(days=28) - timedelta(minutes=5)
+    
+    # Event loop watchdog (seconds)
+    WATCHDOG_INTERVAL = 0.5
+    WATCHDOG_THRESHOLD = 0.25  # Stalls longer than this are logged with a stack sample
+    
+    # Local health endpoint for orchestration (HEALTH_PORT=0 disables it)
+    HEALTH_HOST = os.getenv('HEALTH_HOST', '127.0.0.1')
+    HEALTH_PORT = int(os.getenv('HEALTH_PORT', '8080'))
+    HEALTH_DISCONNECT_GRACE = 60  # Seconds the gateway may be down before we report unhealthy
+    HEALTH_MAX_LOOP_LAG = 5.0  # Seconds of loop lag before we report unhealthy
+    
+    # Moderation log delivery
+    MODLOG_QUEUE_SIZE = 1000
+    MODLOG_FLUSH_SECONDS = 2.0  # How long to coalesce events before sending
+    MODLOG_WEBHOOK_NAME = "Mod Log"
+    MODLOG_WEBHOOK_RETRY_SECONDS = 600  # Wait before retrying a channel whose webhook lookup was refused
+    
+    # Global ban list sync
+    BAN_SYNC_INTERVAL_HOURS = 6
+    BULK_BAN_CHUNK_SIZE = 200  # Discord's bulk ban limit
+    
+    # Bulk role actions (/roleaction)
+    BULK_ACTION_CONCURRENCY = 5  # Members acted on at the same time
+    BULK_CHECKPOINT_EVERY = 25  # Completed members between progress saves
+    BULK_CHECKPOINT_TTL_HOURS = 24  # Progress of an unfinished run is forgotten after this
+    BULK_CONFIRM_TIMEOUT = 60  # Seconds to confirm the preview
+    BULK_PROGRESS_SECONDS = 5  # Seconds between progress updates
+    
+    # Log per-module import time and per-cog setup time at startup
+    STARTUP_PROFILE = os.getenv('STARTUP_PROFILE', '0') == '1'
+    
     @classmethod
     def validate(cls):
         """Validate configuration"""
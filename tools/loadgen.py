@@ -0,0 +1,198 @@
+"""Replay synthetic interaction traffic against the bot's commands
+
+Runs the real cogs and help command in-process, with discord.py's REST
+calls answered by a local stand-in, and reports latency percentiles,
+throughput and memory growth.
+
+    python -m tools.loadgen --rate 200 --duration 60 --mix ban=1,mute=1,help=2
+"""
+import argparse
+import asyncio
+import gc
+import itertools
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+
+# Keep load-test state out of the real database
+os.environ.setdefault('DATABASE_PATH', ':memory:')
+
+import discord
+from tools.rest_standin import (
+    RestStandIn, guild_payload, interaction_payload, target_options, OWNER_ID
+)
+
+GUILD_BASE_ID = 800000000000000000
+USER_BASE_ID = 700000000000000000
+MODERATOR_ID = 600000000000000001
+
+def current_rss():
+    """Resident set size in bytes (Linux), falling back to peak RSS elsewhere"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * pct / 100), len(sorted_values) - 1)
+    return sorted_values[index]
+
+def parse_mix(value):
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name not in ('ban', 'mute', 'help'):
+            raise argparse.ArgumentTypeError(f'unknown command {name!r}, expected ban, mute or help')
+        mix[name] = float(weight or 1)
+    return mix
+
+class LoadGenerator:
+    """Builds interactions for a mix of commands and drives them at a fixed rate"""
+
+    def __init__(self, bot, guilds, mix, seed=0):
+        self.bot = bot
+        self.guilds = guilds  # [(guild_id, moderator_role_id)]
+        self.names = list(mix)
+        self.weights = list(mix.values())
+        self.random = random.Random(seed)
+        self.ids = itertools.count(1)
+        self.latencies = []
+        self.failures = 0
+
+    def build(self, name):
+        interaction_id = 500000000000000000 + next(self.ids)
+        guild_id, moderator_role_id = self.random.choice(self.guilds)
+        if name == 'help':
+            user_id = OWNER_ID if self.random.random() < 0.1 else MODERATOR_ID
+            payload = interaction_payload(interaction_id, guild_id, user_id, (), 'help')
+        else:
+            target_id = USER_BASE_ID + self.random.randrange(1_000_000)
+            options, resolved = target_options(target_id, 'load test')
+            payload = interaction_payload(
+                interaction_id, guild_id, MODERATOR_ID, (moderator_role_id,), name, options, resolved
+            )
+        return discord.Interaction(data=payload, state=self.bot._connection)
+
+    async def run_one(self, name):
+        interaction = self.build(name)
+        start = time.perf_counter()
+        try:
+            await self.bot.tree._call(interaction)
+        except Exception:
+            self.failures += 1
+        else:
+            if interaction.command_failed:
+                self.failures += 1
+        self.latencies.append(time.perf_counter() - start)
+
+    async def run(self, rate, duration, on_tick=None):
+        """Start rate interactions per second for duration seconds, then wait for them"""
+        loop = asyncio.get_running_loop()
+        tasks = set()
+        total = int(rate * duration)
+        start = loop.time()
+        for i in range(total):
+            delay = start + i / rate - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            name = self.random.choices(self.names, self.weights)[0]
+            task = asyncio.create_task(self.run_one(name))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            if on_tick is not None and i % max(int(rate), 1) == 0:
+                on_tick(i)
+        if tasks:
+            await asyncio.gather(*tasks)
+        return loop.time() - start
+
+async def main(args):
+    import bot as bot_module
+    from config import Config
+
+    if args.quiet:
+        bot_module.logger.setLevel('WARNING')
+
+    standin = RestStandIn(latency=args.latency)
+    await standin.start()
+    bot = bot_module.bot
+    try:
+        await bot.login('loadgen-token')
+        await bot_module.load_cogs(Config.COGS)
+        bot.watchdog.start()
+
+        guilds = []
+        for n in range(args.guilds):
+            guild_id = GUILD_BASE_ID + n * 10
+            moderator_role_id, mute_role_id = guild_id + 2, guild_id + 3
+            bot._connection._add_guild_from_data(
+                guild_payload(guild_id, f'Load Guild {n}', moderator_role_id, mute_role_id)
+            )
+            guilds.append((guild_id, moderator_role_id))
+
+        generator = LoadGenerator(bot, guilds, args.mix, args.seed)
+
+        # Warm up code paths and caches before measuring
+        await generator.run(min(args.rate, 50), 1)
+        generator.latencies.clear()
+        generator.failures = 0
+
+        # tracemalloc is exact but slows the interpreter a lot, so RSS is the default
+        measure = (lambda: tracemalloc.get_traced_memory()[0]) if args.trace_memory else current_rss
+        gc.collect()
+        if args.trace_memory:
+            tracemalloc.start()
+        baseline = measure()
+        memory = []
+
+        def sample(_):
+            memory.append(measure() - baseline)
+
+        elapsed = await generator.run(args.rate, args.duration, on_tick=sample)
+        gc.collect()
+        growth = measure() - baseline
+        if args.trace_memory:
+            tracemalloc.stop()
+
+        latencies = sorted(generator.latencies)
+        lag = bot.watchdog.stats()
+        print(f'Interactions:  {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.1f}/s, target {args.rate}/s)')
+        print(f'Failures:      {generator.failures}')
+        print(f'Latency (ms):  p50 {percentile(latencies, 50) * 1000:.2f}  '
+              f'p95 {percentile(latencies, 95) * 1000:.2f}  '
+              f'p99 {percentile(latencies, 99) * 1000:.2f}  '
+              f'max {latencies[-1] * 1000 if latencies else 0:.2f}')
+        print(f'Loop lag (ms): p95 {lag["p95"] * 1000:.2f}  max {lag["max"] * 1000:.2f}  stalls {lag["stalls"]}')
+        print(f'Memory ({"traced" if args.trace_memory else "RSS"}): +{growth / 1024:.1f} KiB retained after run, '
+              f'peak +{max(memory, default=0) / 1024:.1f} KiB during')
+        print('REST calls:')
+        for (method, route), count in standin.requests.most_common():
+            print(f'  {count:8d}  {method:6s} {route}')
+    finally:
+        bot.watchdog.stop()
+        await bot.close()
+        await standin.stop()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rate', type=float, default=100, help='interactions started per second')
+    parser.add_argument('--duration', type=float, default=10, help='seconds to generate load for')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('ban=1,mute=1,help=2'),
+                        help='weighted command mix, e.g. ban=1,mute=1,help=2')
+    parser.add_argument('--guilds', type=int, default=10, help='number of synthetic guilds')
+    parser.add_argument('--latency', type=float, default=0.0, help='stand-in REST latency in seconds')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for the traffic mix')
+    parser.add_argument('--trace-memory', action='store_true', help='measure Python allocations with tracemalloc (slow)')
+    parser.add_argument('--quiet', action='store_true', help='only log warnings from the bot')
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(main(parse_args()))
+    except KeyboardInterrupt:
+        sys.exit(130)
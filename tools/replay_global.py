@@ -0,0 +1,199 @@
+"""Replay the global moderation commands against scripted partial failures
+
+Every guild gets one scripted outcome for the target user (missing member,
+403, 404, 429, gateway timeout, slow response or success). The real
+/globalban, /globalkick, /globalmute and /globalunmute handlers then run
+against the local REST stand-in. The tool checks the reported summary
+counts, the number of retried requests and the total completion time, and
+exits non-zero on any mismatch.
+
+    python -m tools.replay_global --guilds 14 --seed 1
+"""
+import argparse
+import asyncio
+import os
+import random
+import re
+import sys
+import time
+
+# Keep replay state out of the real database
+os.environ.setdefault('DATABASE_PATH', ':memory:')
+
+import discord
+from tools.rest_standin import RestStandIn, guild_payload, interaction_payload
+
+GUILD_BASE_ID = 810000000000000000
+USER_BASE_ID = 710000000000000000
+
+# name: (request the fault applies to, fault options, expected tally, retried requests, minimum seconds added)
+OUTCOMES = {
+    'ok': (None, {}, 'success', 0, 0.0),
+    'absent': ('lookup', {'status': 404}, None, 0, 0.0),
+    'forbidden': ('action', {'status': 403}, 'failure', 0, 0.0),
+    'vanished': ('action', {'status': 404}, 'failure', 0, 0.0),  # Left between lookup and action
+    'ratelimited': ('action', {'status': 429, 'times': 1, 'retry_after': 0.25}, 'success', 1, 0.25),
+    'timeout': ('action', {'status': 504, 'times': 1}, 'success', 1, 1.0),  # discord.py waits 1s before retrying
+    'slow': ('action', {'delay': 0.3}, 'success', 0, 0.3),
+}
+
+# name: (summary label, action method, action path, whether the member is looked up first)
+COMMANDS = {
+    'globalban': ('Banned from', 'PUT', '/guilds/{guild_id}/bans/{user_id}', False),  # Bans by ID everywhere
+    'globalkick': ('Kicked from', 'DELETE', '/guilds/{guild_id}/members/{user_id}', True),
+    'globalmute': ('Muted in', 'PUT', '/guilds/{guild_id}/members/{user_id}/roles/{mute_role_id}', True),
+    'globalunmute': ('Unmuted in', 'DELETE', '/guilds/{guild_id}/members/{user_id}/roles/{mute_role_id}', True),
+}
+
+def assign_outcomes(guild_count, seed):
+    """Spread the outcomes over the guilds, every outcome at least once if there are enough guilds"""
+    names = list(OUTCOMES)
+    outcomes = [names[i % len(names)] for i in range(guild_count)]
+    random.Random(seed).shuffle(outcomes)
+    return outcomes
+
+def summary_counts(message, label):
+    """Read (succeeded, failed) back from a ResultSummary embed"""
+    fields = {field['name']: field['value'] for field in message['embeds'][0]['fields']}
+    count = lambda value: int(re.match(r'\d+', value).group())
+    return count(fields[label]), count(fields['Failed'])
+
+class Replay:
+    """Scripts the faults for one command run and checks what the command reported"""
+
+    def __init__(self, bot, standin, guilds, outcomes, owner_id, slack):
+        self.bot = bot
+        self.standin = standin
+        self.guilds = guilds  # [(guild_id, mute_role_id)]
+        self.outcomes = outcomes
+        self.owner_id = owner_id
+        self.slack = slack
+        self.interaction_ids = iter(range(510000000000000000, 520000000000000000))
+        self.problems = []
+
+    def script(self, command, user_id):
+        """Add the faults for this command and return what we expect to see"""
+        _, method, action_path, looks_up = COMMANDS[command]
+        expected = {'success': 0, 'failure': 0, 'requests': {}, 'seconds': 0.0}
+        for (guild_id, mute_role_id), outcome in zip(self.guilds, self.outcomes):
+            where, fault, tally, retries, seconds = OUTCOMES[outcome]
+            if where == 'lookup' and not looks_up:
+                # A missing member doesn't matter to a command that never looks them up
+                where, fault, tally, retries, seconds = OUTCOMES['ok']
+            path = action_path.format(guild_id=guild_id, user_id=user_id, mute_role_id=mute_role_id)
+            if command == 'globalunmute':
+                # The member must hold the mute role for there to be anything to undo
+                self.standin.member_roles[(guild_id, user_id)] = (mute_role_id,)
+            if where == 'lookup':
+                self.standin.add_fault('GET', rf'^/guilds/{guild_id}/members/{user_id}$', **fault)
+            elif where == 'action':
+                self.standin.add_fault(method, rf'^{re.escape(path)}$', **fault)
+            if tally:
+                expected[tally] += 1
+            expected['requests'][(method, path)] = 0 if where == 'lookup' else 1 + retries
+            expected['seconds'] += seconds
+        return expected
+
+    async def run(self, command, user_id):
+        label = COMMANDS[command][0]
+        expected = self.script(command, user_id)
+        options = [{'name': 'user_id', 'type': 3, 'value': str(user_id)}]
+        if command != 'globalunmute':
+            options.append({'name': 'reason', 'type': 3, 'value': 'replay'})
+
+        guild_id = self.guilds[0][0]
+        payload = interaction_payload(next(self.interaction_ids), guild_id, self.owner_id, (), command, options)
+        interaction = discord.Interaction(data=payload, state=self.bot._connection)
+
+        sent = len(self.standin.messages)
+        log_start = len(self.standin.log)
+        start = time.perf_counter()
+        await self.bot.tree._call(interaction)
+        elapsed = time.perf_counter() - start
+
+        problems = []
+        succeeded = failed = None
+        if interaction.command_failed or len(self.standin.messages) == sent:
+            problems.append('command failed without sending a summary')
+        else:
+            succeeded, failed = summary_counts(self.standin.messages[-1], label)
+            if (succeeded, failed) != (expected['success'], expected['failure']):
+                problems.append(f"summary {succeeded} ok/{failed} failed, "
+                                f"expected {expected['success']}/{expected['failure']}")
+
+        seen = {}
+        for _, method, path, _ in self.standin.log[log_start:]:
+            if (method, path) in expected['requests']:
+                seen[(method, path)] = seen.get((method, path), 0) + 1
+        retried = sum(max(count - 1, 0) for count in seen.values())
+        for request, count in expected['requests'].items():
+            if seen.get(request, 0) != count:
+                problems.append(f'{request[0]} {request[1]}: {seen.get(request, 0)} requests, expected {count}')
+
+        # Concurrency changes may make this faster, but never slower than running the guilds one by one
+        budget = expected['seconds'] + self.slack
+        if elapsed > budget:
+            problems.append(f'took {elapsed:.2f}s, budget {budget:.2f}s')
+
+        status = 'ok' if not problems else 'FAIL'
+        print(f'{command:13s} {status:4s}  {elapsed:6.2f}s (sequential floor {expected["seconds"]:.2f}s)  '
+              f'{succeeded} ok, {failed} failed, {retried} retried')
+        for problem in problems:
+            print(f'    - {problem}')
+        self.problems.extend(f'{command}: {problem}' for problem in problems)
+
+async def main(args):
+    import bot as bot_module
+    from config import Config
+
+    if args.quiet:
+        bot_module.logger.setLevel('CRITICAL')
+
+    standin = RestStandIn(latency=args.latency)
+    await standin.start()
+    bot = bot_module.bot
+    try:
+        await bot.login('replay-token')
+        await bot_module.load_cogs(Config.COGS)
+
+        guilds = []
+        for n in range(args.guilds):
+            guild_id = GUILD_BASE_ID + n * 10
+            moderator_role_id, mute_role_id = guild_id + 2, guild_id + 3
+            bot._connection._add_guild_from_data(
+                guild_payload(guild_id, f'Replay Guild {n}', moderator_role_id, mute_role_id)
+            )
+            guilds.append((guild_id, mute_role_id))
+
+        outcomes = assign_outcomes(args.guilds, args.seed)
+        print('Outcomes: ' + ', '.join(f'{name}={outcomes.count(name)}' for name in OUTCOMES))
+        replay = Replay(bot, standin, guilds, outcomes, Config.OWNER_ID, args.slack)
+        for n, command in enumerate(args.commands):
+            # A fresh target per command keeps faults and cached members from leaking between runs
+            await replay.run(command, USER_BASE_ID + n)
+    finally:
+        await bot.close()
+        await standin.stop()
+
+    if replay.problems:
+        print(f'{len(replay.problems)} mismatches')
+        return 1
+    print('All global commands matched the scripted outcomes')
+    return 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--guilds', type=int, default=len(OUTCOMES) * 2, help='number of synthetic guilds')
+    parser.add_argument('--seed', type=int, default=0, help='seed for assigning outcomes to guilds')
+    parser.add_argument('--latency', type=float, default=0.0, help='stand-in REST latency in seconds')
+    parser.add_argument('--slack', type=float, default=2.0, help='seconds allowed on top of the scripted delays')
+    parser.add_argument('--commands', nargs='+', choices=list(COMMANDS), default=list(COMMANDS),
+                        help='global commands to replay')
+    parser.add_argument('--quiet', action='store_true', help='silence the bot\'s own logging')
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    try:
+        sys.exit(asyncio.run(main(parse_args())))
+    except KeyboardInterrupt:
+        sys.exit(130)
@@ -0,0 +1,336 @@
+"""Local stand-in for the Discord REST API used by the load and replay tools
+
+Serves just enough of the API for the bot's commands to run end to end:
+interaction callbacks, followups, bans, kicks, role changes, member and
+user lookups. Every request is counted, and scripted faults can make
+matching requests fail or slow down.
+"""
+import asyncio
+import json
+import re
+import time
+from collections import Counter
+from urllib.parse import unquote
+from aiohttp import web
+import discord
+
+BOT_ID = 900000000000000001
+APP_ID = BOT_ID
+OWNER_ID = 900000000000000002
+
+def user_payload(user_id, name=None, bot=False):
+    return {
+        'id': str(user_id),
+        'username': name or f'user{user_id % 100000}',
+        'discriminator': '0',
+        'global_name': None,
+        'avatar': None,
+        'bot': bot,
+    }
+
+def member_payload(user_id, roles=(), include_user=True):
+    data = {
+        'roles': [str(role_id) for role_id in roles],
+        'joined_at': '2024-01-01T00:00:00+00:00',
+        'deaf': False,
+        'mute': False,
+        'flags': 0,
+        'communication_disabled_until': None,
+    }
+    if include_user:
+        data['user'] = user_payload(user_id)
+    return data
+
+def role_payload(role_id, name, position, permissions=0):
+    return {
+        'id': str(role_id),
+        'name': name,
+        'color': 0,
+        'hoist': False,
+        'position': position,
+        'permissions': str(permissions),
+        'managed': False,
+        'mentionable': False,
+        'flags': 0,
+    }
+
+def message_payload(channel_id, message_id=1):
+    return {
+        'id': str(message_id),
+        'channel_id': str(channel_id),
+        'author': user_payload(BOT_ID, 'standin-bot', bot=True),
+        'content': '',
+        'timestamp': '2024-01-01T00:00:00+00:00',
+        'edited_timestamp': None,
+        'tts': False,
+        'mention_everyone': False,
+        'mentions': [],
+        'mention_roles': [],
+        'attachments': [],
+        'embeds': [],
+        'pinned': False,
+        'type': 0,
+    }
+
+APPLICATION_PAYLOAD = {
+    'id': str(APP_ID),
+    'name': 'standin',
+    'icon': None,
+    'description': '',
+    'rpc_origins': [],
+    'bot_public': False,
+    'bot_require_code_grant': False,
+    'owner': user_payload(OWNER_ID, 'owner'),
+    'verify_key': '',
+    'flags': 0,
+}
+
+def json_response(body, status=200, headers=None):
+    # discord.py only decodes bodies whose Content-Type is exactly application/json
+    headers = dict(headers or {}, **{'Content-Type': 'application/json'})
+    return web.Response(body=json.dumps(body).encode(), status=status, headers=headers)
+
+class Fault:
+    """A scripted response for requests matching a method and path pattern
+
+    status: HTTP status to return (429 includes a retry_after)
+    delay: seconds to wait before responding (simulates latency or a hang)
+    times: how many matching requests to affect, None for all of them
+    """
+
+    def __init__(self, method, path, status=None, delay=0.0, times=None, retry_after=0.05):
+        self.method = method
+        self.path = re.compile(path)
+        self.status = status
+        self.delay = delay
+        self.times = times
+        self.retry_after = retry_after
+        self.hits = 0
+
+    def matches(self, method, path):
+        if self.times is not None and self.hits >= self.times:
+            return False
+        return (self.method == '*' or self.method == method) and self.path.search(path) is not None
+
+class RestStandIn:
+    """Local aiohttp server that answers discord.py's REST calls"""
+
+    def __init__(self, latency=0.0, host='127.0.0.1', port=0):
+        self.latency = latency
+        self.host = host
+        self.port = port
+        self.faults = []
+        self.requests = Counter()  # {(method, route): count}
+        self.statuses = Counter()  # {status: count}
+        self.log = []  # (monotonic time, method, path, status)
+        self.member_roles = {}  # {(guild_id, user_id): role IDs} returned by member lookups
+        self.bans = {}  # {(guild_id, user_id): reason} placed through or seeded into the stand-in
+        self.messages = []  # JSON bodies of messages sent through webhooks (followups)
+        self._runner = None
+        self._original_base = None
+        self._message_id = 1
+
+    def add_fault(self, *args, **kwargs):
+        fault = Fault(*args, **kwargs)
+        self.faults.append(fault)
+        return fault
+
+    async def start(self):
+        """Start the server and point discord.py at it"""
+        app = web.Application()
+        app.router.add_route('*', '/api/v10/{path:.*}', self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+        self._original_base = discord.http.Route.BASE
+        discord.http.Route.BASE = f'http://{self.host}:{self.port}/api/v10'
+        return discord.http.Route.BASE
+
+    async def stop(self):
+        if self._original_base is not None:
+            discord.http.Route.BASE = self._original_base
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    @staticmethod
+    def route_name(path):
+        """Collapse snowflakes and tokens so requests can be grouped"""
+        path = re.sub(r'/\d{15,20}', '/{id}', path)
+        return re.sub(r'(/interactions/\{id\}|/webhooks/\{id\})/[^/]+', r'\1/{token}', path)
+
+    def _record(self, method, path, status):
+        self.requests[(method, self.route_name(path))] += 1
+        self.statuses[status] += 1
+        self.log.append((time.monotonic(), method, path, status))
+
+    async def _handle(self, request):
+        method = request.method
+        path = '/' + request.match_info['path']
+
+        for fault in self.faults:
+            if fault.matches(method, path):
+                fault.hits += 1
+                if fault.delay:
+                    await asyncio.sleep(fault.delay)
+                if fault.status is not None:
+                    self._record(method, path, fault.status)
+                    return self._error(fault)
+                break
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        status, body = await self._default(request, method, path)
+        self._record(method, path, status)
+        if body is None:
+            return web.Response(status=status)
+        return json_response(body, status=status)
+
+    @staticmethod
+    def _error(fault):
+        if fault.status == 429:
+            body = {'message': 'You are being rate limited.', 'retry_after': fault.retry_after, 'global': False}
+            headers = {
+                'X-RateLimit-Limit': '1',
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset-After': str(fault.retry_after),
+                'X-RateLimit-Bucket': 'standin',
+                'X-RateLimit-Scope': 'user',
+                # Without this discord.py treats the 429 as a Cloudflare ban and doesn't retry
+                'Via': '1.1 google',
+            }
+            return json_response(body, status=429, headers=headers)
+        messages = {403: 'Missing Permissions', 404: 'Unknown Member'}
+        body = {'message': messages.get(fault.status, 'Server error'), 'code': 0}
+        return json_response(body, status=fault.status)
+
+    async def _default(self, request, method, path):
+        if path == '/users/@me':
+            return 200, user_payload(BOT_ID, 'standin-bot', bot=True)
+        if path == '/oauth2/applications/@me':
+            return 200, APPLICATION_PAYLOAD
+
+        match = re.fullmatch(r'/interactions/(\d+)/[^/]+/callback', path)
+        if match:
+            payload = await request.json() if request.can_read_body else {}
+            data = payload.get('data') or {}
+            return 200, {
+                'interaction': {
+                    'id': match.group(1),
+                    'type': 2,
+                    'response_message_loading': payload.get('type') == 5,
+                    'response_message_ephemeral': bool(data.get('flags', 0) & 64),
+                },
+            }
+
+        if re.fullmatch(r'/webhooks/\d+/[^/]+(/messages/.+)?', path):
+            if request.content_type == 'application/json':
+                self.messages.append(await request.json())
+            self._message_id += 1
+            return 200, message_payload(1, self._message_id)
+
+        match = re.fullmatch(r'/users/(\d+)', path)
+        if match:
+            return 200, user_payload(int(match.group(1)))
+
+        match = re.fullmatch(r'/guilds/(\d+)/members/(\d+)', path)
+        if match and method == 'GET':
+            guild_id, user_id = int(match.group(1)), int(match.group(2))
+            return 200, member_payload(user_id, self.member_roles.get((guild_id, user_id), ()))
+
+        if re.fullmatch(r'/guilds/\d+/roles', path) and method == 'POST':
+            payload = await request.json()
+            return 200, role_payload(int(time.time() * 1000) << 22, payload.get('name', 'role'), 1)
+
+        if re.fullmatch(r'/guilds/\d+/bans', path) and method == 'GET':
+            return 200, []
+
+        match = re.fullmatch(r'/guilds/(\d+)/bans/(\d+)', path)
+        if match:
+            key = (int(match.group(1)), int(match.group(2)))
+            if method == 'PUT':
+                self.bans[key] = unquote(request.headers.get('X-Audit-Log-Reason', '')) or None
+                return 204, None
+            if key not in self.bans:
+                return 404, {'message': 'Unknown Ban', 'code': 10026}
+            if method == 'DELETE':
+                del self.bans[key]
+                return 204, None
+            return 200, {'reason': self.bans[key], 'user': user_payload(key[1])}
+
+        if re.fullmatch(r'/guilds/\d+/bulk-ban', path):
+            payload = await request.json()
+            return 200, {'banned_users': payload.get('user_ids', []), 'failed_users': []}
+
+        # Bans, kicks, role changes, permission overwrites, unbans...
+        return 204, None
+
+def guild_payload(guild_id, name, moderator_role_id, mute_role_id, extra_roles=()):
+    """Guild with @everyone, a Moderator role that can ban/kick/manage roles, and a Muted role"""
+    permissions = discord.Permissions(ban_members=True, kick_members=True, manage_roles=True, moderate_members=True).value
+    roles = [
+        role_payload(guild_id, '@everyone', 0),
+        role_payload(mute_role_id, 'Muted', 1),
+        role_payload(moderator_role_id, 'Moderator', 5, permissions),
+    ]
+    roles.extend(extra_roles)
+    return {
+        'id': str(guild_id),
+        'name': name,
+        'icon': None,
+        'owner_id': str(OWNER_ID),
+        'roles': roles,
+        'emojis': [],
+        'stickers': [],
+        'features': [],
+        'channels': [],
+        'threads': [],
+        'members': [member_payload(BOT_ID, roles=(moderator_role_id,))],
+        'member_count': 1000,
+        'large': False,
+        'unavailable': False,
+        'premium_tier': 0,
+        'verification_level': 0,
+        'default_message_notifications': 0,
+        'explicit_content_filter': 0,
+        'mfa_level': 0,
+        'nsfw_level': 0,
+        'preferred_locale': 'en-US',
+        'system_channel_flags': 0,
+    }
+
+def interaction_payload(interaction_id, guild_id, user_id, user_roles, name, options=(), resolved=None):
+    """APPLICATION_COMMAND interaction as the gateway would deliver it"""
+    member = member_payload(user_id, roles=user_roles)
+    member['permissions'] = str(discord.Permissions.all().value)
+    data = {'id': str(interaction_id), 'name': name, 'type': 1, 'options': list(options)}
+    if resolved:
+        data['resolved'] = resolved
+    return {
+        'id': str(interaction_id),
+        'application_id': str(APP_ID),
+        'type': 2,
+        'token': f'token-{interaction_id}',
+        'version': 1,
+        'guild_id': str(guild_id),
+        'channel_id': str(guild_id + 1),
+        'channel': {'id': str(guild_id + 1), 'type': 0, 'guild_id': str(guild_id), 'name': 'general', 'position': 0},
+        'member': member,
+        'app_permissions': str(discord.Permissions.all().value),
+        'locale': 'en-US',
+        'data': data,
+    }
+
+def target_options(user_id, reason=None):
+    """Options and resolved data for a command taking a member (and reason)"""
+    options = [{'name': 'member', 'type': 6, 'value': str(user_id)}]
+    if reason is not None:
+        options.append({'name': 'reason', 'type': 3, 'value': reason})
+    resolved = {
+        'users': {str(user_id): user_payload(user_id)},
+        'members': {str(user_id): member_payload(user_id, include_user=False)},
+    }
+    return options, resolved
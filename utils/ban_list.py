@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+# Every ban the bot places for the federation has a reason starting with this
+GLOBAL_BAN_REASON = "Global ban"
+
+def is_global_ban(reason):
+    """Whether a guild ban was placed by the bot rather than the guild's own moderators"""
+    return bool(reason) and reason.startswith(GLOBAL_BAN_REASON)
+
+class GlobalBanList:
+    """Persistent set of globally banned user IDs shared across guilds"""
+
+    def __init__(self, db):
+        self.db = db
+        self.user_ids = set()
+        self.reasons = {}  # {user_id: reason}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def load(self):
+        """Load the list from the database on first use"""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            await self.db.execute(
+                'CREATE TABLE IF NOT EXISTS global_bans ('
+                'user_id INTEGER PRIMARY KEY, reason TEXT, created_at REAL)'
+            )
+            rows = await self.db.fetchall('SELECT user_id, reason FROM global_bans')
+            self.user_ids = {user_id for user_id, _ in rows}
+            self.reasons = {user_id: reason for user_id, reason in rows}
+            self._loaded = True
+
+    async def add(self, user_id, reason):
+        """Add a user to the global ban list"""
+        await self.load()
+        await self.db.execute(
+            'INSERT OR REPLACE INTO global_bans (user_id, reason, created_at) VALUES (?, ?, ?)',
+            (user_id, reason, time.time())
+        )
+        self.user_ids.add(user_id)
+        self.reasons[user_id] = reason
+
+    async def remove(self, user_id):
+        """Remove a user from the global ban list, returns whether they were listed"""
+        await self.load()
+        if user_id not in self.user_ids:
+            return False
+        await self.db.execute('DELETE FROM global_bans WHERE user_id = ?', (user_id,))
+        self.user_ids.discard(user_id)
+        self.reasons.pop(user_id, None)
+        return True
+
+    def missing_from(self, banned_ids):
+        """Return the listed user IDs that are not in a guild's ban set"""
+        return self.user_ids - banned_ids
+
+    def __contains__(self, user_id):
+        return user_id in self.user_ids
+
+    def __len__(self):
+        return len(self.user_ids)
@@ -0,0 +1,63 @@
+import asyncio
+import time
+
+class BulkCheckpoint:
+    """Members already handled by an interrupted bulk role action
+
+    Progress is keyed by (guild, role, action) so running the same command
+    again resumes where the last run stopped instead of starting over.
+    Progress older than ttl seconds is discarded, so a fresh run much later
+    doesn't skip members whose state changed since.
+    """
+
+    def __init__(self, db, ttl=86400):
+        self.db = db
+        self.ttl = ttl
+        self._ready = False
+        self._lock = asyncio.Lock()
+
+    async def _create_table(self):
+        if self._ready:
+            return
+        async with self._lock:
+            if self._ready:
+                return
+            await self.db.execute(
+                'CREATE TABLE IF NOT EXISTS bulk_progress ('
+                'guild_id INTEGER NOT NULL, role_id INTEGER NOT NULL, action TEXT NOT NULL, user_id INTEGER NOT NULL, '
+                'created_at REAL NOT NULL DEFAULT 0, PRIMARY KEY (guild_id, role_id, action, user_id))'
+            )
+            columns = {row[1] for row in await self.db.fetchall('PRAGMA table_info(bulk_progress)')}
+            if 'created_at' not in columns:
+                # Tables from before progress expired; their rows count as expired
+                await self.db.execute('ALTER TABLE bulk_progress ADD COLUMN created_at REAL NOT NULL DEFAULT 0')
+            self._ready = True
+
+    async def done(self, guild_id, role_id, action):
+        """Return the user IDs already handled for this job, dropping expired progress first"""
+        await self._create_table()
+        await self.db.execute('DELETE FROM bulk_progress WHERE created_at < ?', (time.time() - self.ttl,))
+        rows = await self.db.fetchall(
+            'SELECT user_id FROM bulk_progress WHERE guild_id = ? AND role_id = ? AND action = ?',
+            (guild_id, role_id, action)
+        )
+        return {user_id for user_id, in rows}
+
+    async def record(self, guild_id, role_id, action, user_ids):
+        """Mark a batch of users as handled"""
+        if not user_ids:
+            return
+        await self._create_table()
+        now = time.time()
+        await self.db.executemany(
+            'INSERT OR REPLACE INTO bulk_progress (guild_id, role_id, action, user_id, created_at) VALUES (?, ?, ?, ?, ?)',
+            [(guild_id, role_id, action, user_id, now) for user_id in user_ids]
+        )
+
+    async def clear(self, guild_id, role_id, action):
+        """Forget a job's progress once it finished"""
+        await self._create_table()
+        await self.db.execute(
+            'DELETE FROM bulk_progress WHERE guild_id = ? AND role_id = ? AND action = ?',
+            (guild_id, role_id, action)
+        )
@@ -0,0 +1,49 @@
+import asyncio
+import sqlite3
+import threading
+
+class Database:
+    """Small async wrapper around the bot's local SQLite database"""
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        return self._conn
+
+    def _execute(self, query, params, many):
+        with self._lock:
+            conn = self._connection()
+            if many:
+                conn.executemany(query, params)
+            else:
+                conn.execute(query, params)
+            conn.commit()
+
+    def _fetchall(self, query, params):
+        with self._lock:
+            return self._connection().execute(query, params).fetchall()
+
+    async def execute(self, query, params=()):
+        """Run a write statement off the event loop"""
+        await asyncio.to_thread(self._execute, query, params, False)
+
+    async def executemany(self, query, rows):
+        """Run a write statement for many rows off the event loop"""
+        await asyncio.to_thread(self._execute, query, rows, True)
+
+    async def fetchall(self, query, params=()):
+        """Run a read query off the event loop"""
+        return await asyncio.to_thread(self._fetchall, query, params)
+
+    def close(self):
+        """Close the underlying connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,136 @@
+import asyncio
+import json
+from types import MappingProxyType
+
+# Settings every guild starts with; stored rows only hold overrides
+DEFAULTS = MappingProxyType({
+    'mute_role': 'Muted',          # Name of the mute role
+    'mute_backend': 'role',        # 'role' (mute role) or 'timeout' (Discord timeout)
+    'log_channel_id': None,        # Moderation log channel
+    'automod_max_mentions': 5,     # Mentions allowed in one message
+    'automod_max_messages': 8,     # Messages allowed per 10 seconds
+    'moderator_role_ids': (),      # Roles allowed to moderate without Discord permissions
+})
+
+MUTE_BACKENDS = ('role', 'timeout')
+
+class GuildConfigStore:
+    """Per-guild settings backed by the local database and cached in memory
+
+    Reads are plain dict lookups on an immutable snapshot; writes replace the
+    snapshot and bump the guild's version so other processes editing the
+    database are picked up by reload().
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._cache = {}  # {guild_id: MappingProxyType of settings}
+        self._versions = {}  # {guild_id: version}
+        self._active = None  # Guild IDs the bot is in, None until the first compaction
+        self._lock = asyncio.Lock()
+
+    async def _create_table(self):
+        await self.db.execute(
+            'CREATE TABLE IF NOT EXISTS guild_config ('
+            'guild_id INTEGER PRIMARY KEY, data TEXT NOT NULL, version INTEGER NOT NULL)'
+        )
+
+    @staticmethod
+    def _snapshot(data):
+        settings = dict(DEFAULTS)
+        for key, value in data.items():
+            if key in DEFAULTS:
+                settings[key] = tuple(value) if isinstance(value, list) else value
+        return MappingProxyType(settings)
+
+    async def load(self):
+        """Load every stored guild's settings into the cache"""
+        async with self._lock:
+            await self._create_table()
+            rows = await self.db.fetchall('SELECT guild_id, data, version FROM guild_config')
+            self._cache = {guild_id: self._snapshot(json.loads(data)) for guild_id, data, _ in rows}
+            self._versions = {guild_id: version for guild_id, _, version in rows}
+
+    def get(self, guild_id):
+        """Return the guild's settings (hot path, no I/O)"""
+        return self._cache.get(guild_id, DEFAULTS)
+
+    async def set(self, guild_id, key, value):
+        """Update one setting and persist it"""
+        if key not in DEFAULTS:
+            raise KeyError(key)
+        async with self._lock:
+            # Merge the key and bump the version in the stored row itself, so a
+            # concurrent write from another process is neither lost nor reused
+            if DEFAULTS[key] == value:
+                await self.db.execute(
+                    "INSERT INTO guild_config (guild_id, data, version) VALUES (?, '{}', 1) "
+                    'ON CONFLICT(guild_id) DO UPDATE SET '
+                    "data = json_remove(guild_config.data, '$.' || ?), version = guild_config.version + 1",
+                    (guild_id, key)
+                )
+            else:
+                await self.db.execute(
+                    'INSERT INTO guild_config (guild_id, data, version) VALUES (?, json_object(?, json(?)), 1) '
+                    'ON CONFLICT(guild_id) DO UPDATE SET '
+                    "data = json_set(guild_config.data, '$.' || ?, json(?)), version = guild_config.version + 1",
+                    (guild_id, key, json.dumps(value), key, json.dumps(value))
+                )
+            rows = await self.db.fetchall('SELECT data, version FROM guild_config WHERE guild_id = ?', (guild_id,))
+            data, version = rows[0]
+            self._cache[guild_id] = self._snapshot(json.loads(data))
+            self._versions[guild_id] = version
+        return self._cache[guild_id]
+
+    async def reload(self):
+        """Refresh only the guilds whose stored version changed, returns how many"""
+        async with self._lock:
+            rows = await self.db.fetchall('SELECT guild_id, version FROM guild_config')
+            stored = {
+                guild_id: version for guild_id, version in rows
+                if self._active is None or guild_id in self._active
+            }
+            changed = [guild_id for guild_id, version in stored.items() if self._versions.get(guild_id) != version]
+            for guild_id in set(self._cache) - set(stored):
+                self._cache.pop(guild_id, None)
+                self._versions.pop(guild_id, None)
+            for guild_id in changed:
+                rows = await self.db.fetchall('SELECT data, version FROM guild_config WHERE guild_id = ?', (guild_id,))
+                if rows:
+                    data, version = rows[0]
+                    self._cache[guild_id] = self._snapshot(json.loads(data))
+                    self._versions[guild_id] = version
+            return len(changed)
+
+    async def activate(self, guild_id):
+        """Load a guild's settings again after it was dropped, e.g. when the bot rejoins it"""
+        if self._active is None or guild_id in self._active:
+            return
+        self._active.add(guild_id)
+        async with self._lock:
+            rows = await self.db.fetchall('SELECT data, version FROM guild_config WHERE guild_id = ?', (guild_id,))
+            if rows:
+                data, version = rows[0]
+                self._cache[guild_id] = self._snapshot(json.loads(data))
+                self._versions[guild_id] = version
+
+    def forget_guild(self, guild_id):
+        """Drop a guild's cached settings; the stored row is kept in case the bot is re-added"""
+        if self._active is not None:
+            self._active.discard(guild_id)
+        self._cache.pop(guild_id, None)
+        self._versions.pop(guild_id, None)
+
+    def compact(self, active_guild_ids):
+        """Only keep settings for guilds the bot is in, returns how many were dropped"""
+        self._active = set(active_guild_ids)
+        stale = [guild_id for guild_id in self._cache if guild_id not in self._active]
+        for guild_id in stale:
+            self._cache.pop(guild_id, None)
+            self._versions.pop(guild_id, None)
+        return len(stale)
+
+def is_moderator(member, settings):
+    """Check whether the member holds one of the guild's moderator roles"""
+    allowed = settings['moderator_role_ids']
+    return bool(allowed) and any(role.id in allowed for role in member.roles)
@@ -0,0 +1,117 @@
+import math
+import time
+from aiohttp import web
+from utils.logger import setup_logger
+from config import Config
+
+logger = setup_logger()
+
+class HealthServer:
+    """Local HTTP health/readiness endpoint served from the bot's event loop
+
+    GET /healthz -> 200 while the process is doing useful work, 503 otherwise
+    GET /readyz  -> 200 once the gateway is ready
+    Both return a JSON body with the numbers behind the decision. A wedged
+    event loop can't answer at all, which orchestration sees as a timeout.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.started_at = time.time()
+        self.last_rest_success = None
+        self.disconnected_at = None
+        self._runner = None
+
+    def track_rest(self):
+        """Record the time of every successful REST call made by the bot"""
+        http = self.bot.http
+        original = http.request
+
+        async def request(route, **kwargs):
+            result = await original(route, **kwargs)
+            self.last_rest_success = time.time()
+            return result
+
+        http.request = request
+
+    async def on_connect(self):
+        self.disconnected_at = None
+
+    async def on_disconnect(self):
+        if self.disconnected_at is None:
+            self.disconnected_at = time.time()
+
+    async def start(self, host, port):
+        """Bind the endpoint, raises OSError if the address can't be used"""
+        app = web.Application()
+        app.router.add_get('/healthz', self.healthz)
+        app.router.add_get('/readyz', self.readyz)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        try:
+            await web.TCPSite(self._runner, host, port).start()
+        except OSError:
+            await self.stop()
+            raise
+
+        self.track_rest()
+        self.bot.add_listener(self.on_connect, 'on_connect')
+        self.bot.add_listener(self.on_connect, 'on_resumed')
+        self.bot.add_listener(self.on_disconnect, 'on_disconnect')
+        logger.info(f'Health endpoint listening on http://{host}:{port}/healthz')
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _shard_latencies(self):
+        latencies = getattr(self.bot, 'latencies', None) or [(self.bot.shard_id or 0, self.bot.latency)]
+        # Latency is inf/nan until the first heartbeat ack
+        return {
+            str(shard_id): None if math.isinf(latency) or math.isnan(latency) else round(latency * 1000, 1)
+            for shard_id, latency in latencies
+        }
+
+    def report(self):
+        """Collect the current health numbers and decide whether we're healthy"""
+        now = time.time()
+        lag = self.bot.watchdog.stats()
+        ws = self.bot.ws
+        connected = ws is not None and ws.open and not self.bot.is_closed()
+        # Count time since the last disconnect, or since startup if we never connected
+        disconnected_for = 0.0 if connected else now - (self.disconnected_at or self.started_at)
+
+        problems = []
+        if self.bot.is_closed():
+            problems.append('client closed')
+        elif disconnected_for > Config.HEALTH_DISCONNECT_GRACE:
+            problems.append('gateway disconnected')
+        if lag['current'] > Config.HEALTH_MAX_LOOP_LAG:
+            problems.append('event loop lagging')
+
+        return {
+            'healthy': not problems,
+            'problems': problems,
+            'ready': self.bot.is_ready(),
+            'gateway_connected': connected,
+            'disconnected_for_s': round(disconnected_for, 1),
+            'shard_latency_ms': self._shard_latencies(),
+            'loop_lag_ms': {key: round(lag[key] * 1000, 1) for key in ('current', 'p95', 'max')},
+            'loop_stalls': lag['stalls'],
+            'queues': {
+                'modlog': self.bot.modlog.queue.qsize(),
+                'modlog_dropped': self.bot.modlog.dropped,
+            },
+            'last_rest_success_s_ago': round(now - self.last_rest_success, 1) if self.last_rest_success else None,
+            'guilds': len(self.bot.guilds),
+            'uptime_s': round(now - self.started_at, 1),
+        }
+
+    async def healthz(self, request):
+        report = self.report()
+        return web.json_response(report, status=200 if report['healthy'] else 503)
+
+    async def readyz(self, request):
+        report = self.report()
+        return web.json_response(report, status=200 if report['ready'] and report['healthy'] else 503)
@@ -0,0 +1,133 @@
+import discord
+from discord import app_commands
+from utils.responses import FrozenEmbed, FIELD_VALUE_LIMIT
+from config import Config
+
+GENERAL_SECTION = "ℹ️ General"
+OWNER_SECTION = "👑 Owner Commands"
+
+class HelpIndex:
+    """Help embeds generated from the registered app command tree
+
+    The owner and public overviews and one detail embed per command are built
+    once and reused until the set of registered commands changes.
+    """
+
+    def __init__(self):
+        self._signature = None
+        self._overviews = {}  # {is_owner: FrozenEmbed}
+        self._details = {}  # {qualified_name: FrozenEmbed}
+        self._owner_only = {}  # {qualified_name: bool}
+
+    @staticmethod
+    def _is_owner_only(command):
+        return command.extras.get('owner_only', getattr(command.binding, 'owner_only', False))
+
+    @staticmethod
+    def _usage(command):
+        params = " ".join(
+            f"<{param.name}>" if param.required else f"[{param.name}]"
+            for param in command.parameters
+        )
+        return f"`/{command.qualified_name}{' ' + params if params else ''}`"
+
+    @staticmethod
+    def _leaf_commands(tree):
+        return sorted(
+            (command for command in tree.walk_commands() if isinstance(command, app_commands.Command)),
+            key=lambda command: command.qualified_name
+        )
+
+    def refresh(self, tree):
+        """Rebuild the embeds if the command tree changed, returns whether it did"""
+        commands = self._leaf_commands(tree)
+        signature = tuple(
+            (command.qualified_name, command.description, tuple(param.name for param in command.parameters))
+            for command in commands
+        )
+        if signature == self._signature:
+            return False
+
+        sections = {}  # {section: [lines]}
+        details = {}
+        owner_only = {}
+        for command in commands:
+            restricted = self._is_owner_only(command)
+            section = OWNER_SECTION if restricted else getattr(command.binding, 'help_section', GENERAL_SECTION)
+            sections.setdefault(section, []).append(f"{self._usage(command)} - {command.description}")
+            owner_only[command.qualified_name] = restricted
+            details[command.qualified_name] = self._build_detail(command, restricted)
+
+        self._overviews = {is_owner: self._build_overview(sections, is_owner) for is_owner in (False, True)}
+        self._details = details
+        self._owner_only = owner_only
+        self._signature = signature
+        return True
+
+    @staticmethod
+    def _build_overview(sections, is_owner):
+        embed = discord.Embed(
+            title="🤖 Bot Commands",
+            description="Multi-purpose Discord bot with global moderation capabilities",
+            color=discord.Color.blue()
+        )
+        # Owner commands last, everything else in order of first appearance
+        for section, lines in sorted(sections.items(), key=lambda item: item[0] == OWNER_SECTION):
+            if section == OWNER_SECTION and not is_owner:
+                continue
+            # Split long sections so no field goes over Discord's limit
+            value = ""
+            for line in lines:
+                if value and len(value) + len(line) + 1 > FIELD_VALUE_LIMIT:
+                    embed.add_field(name=section, value=value, inline=False)
+                    value = ""
+                value = f"{value}\n{line}" if value else line
+            embed.add_field(name=section, value=value, inline=False)
+
+        embed.add_field(
+            name="ℹ️ Information",
+            value=f"Commands: Slash commands only\n"
+                  f"Owner: <@{Config.OWNER_ID}>\n"
+                  f"Use `/help <command>` for details on one command",
+            inline=False
+        )
+        return FrozenEmbed.from_dict(embed.to_dict())
+
+    def _build_detail(self, command, restricted):
+        embed = discord.Embed(
+            title=f"📖 /{command.qualified_name}",
+            description=command.description,
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="Usage", value=self._usage(command), inline=False)
+        if command.parameters:
+            embed.add_field(
+                name="Options",
+                value="\n".join(
+                    f"`{param.name}`{'' if param.required else ' (optional)'} - {param.description}"
+                    for param in command.parameters
+                )[:FIELD_VALUE_LIMIT],
+                inline=False
+            )
+        if restricted:
+            embed.add_field(name="Access", value="Bot owner only", inline=False)
+        return FrozenEmbed.from_dict(embed.to_dict())
+
+    def overview(self, is_owner):
+        """Precomputed command list for owners or everyone else"""
+        return self._overviews[is_owner]
+
+    def detail(self, name, is_owner):
+        """Precomputed detail embed for one command, None if unknown or hidden"""
+        if self._owner_only.get(name) and not is_owner:
+            return None
+        return self._details.get(name)
+
+    def choices(self, current, is_owner):
+        """Autocomplete choices for command names the user can see"""
+        current = current.lower()
+        return [
+            app_commands.Choice(name=name, value=name)
+            for name, restricted in self._owner_only.items()
+            if (is_owner or not restricted) and current in name
+        ][:25]
@@ -0,0 +1,223 @@
+import asyncio
+import time
+from discord.ext import tasks
+from utils.logger import setup_logger
+from config import Config
+
+logger = setup_logger()
+
+def guild_fingerprint(guild):
+    """Cheap summary of the guild state our caches depend on
+
+    Only fields that stay put across a reconnect: member and channel counts
+    drift with every join and leave and would mark every active guild changed.
+    """
+    return hash((
+        guild.owner_id,
+        tuple((role.id, role.position, role.permissions.value, role.name) for role in guild.roles),
+    ))
+
+class Lifecycle:
+    """Separates one-time setup from work that repeats on every (re)connect
+
+    - setup hooks run once, on the first READY of the process
+    - ready hooks run on every later READY (a new gateway session)
+    - shard hooks run on every shard READY
+    - resume hooks run on every RESUMED
+    - warmers run per guild: for every guild after setup, and afterwards
+      only for guilds that are new or whose fingerprint changed. Warmers
+      registered with always=True run for every guild on every READY, for
+      caches that a new session invalidates regardless (discord.py rebuilds
+      every Guild, with an empty member cache, on READY). Guilds that were
+      still unavailable at READY are warmed when they become available
+
+    It also keeps per-guild state bounded: tracked stores are told when the
+    bot leaves a guild or a member leaves one, and are periodically compacted
+    down to the guilds the bot is still in. A tracked store implements any of
+    forget_guild(guild_id), forget_member(guild_id, user_id) and
+    compact(active_guild_ids) -> number of entries dropped.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.setup_done = False
+        self.ready_count = 0
+        self.resume_count = 0
+        self.last_disconnect = None
+        self._setup_hooks = []
+        self._ready_hooks = []
+        self._shard_hooks = []
+        self._resume_hooks = []
+        self._warmers = []  # [(func, always)]
+        self._stores = []
+        self._fingerprints = {}  # {guild_id: fingerprint when last warmed}
+        self._warm_lock = asyncio.Lock()
+        self._warm_task = None
+
+        bot.add_listener(self._on_ready, 'on_ready')
+        bot.add_listener(self._on_shard_ready, 'on_shard_ready')
+        bot.add_listener(self._on_resumed, 'on_resumed')
+        bot.add_listener(self._on_disconnect, 'on_disconnect')
+        bot.add_listener(self._on_guild_join, 'on_guild_join')
+        bot.add_listener(self._on_guild_available, 'on_guild_available')
+        bot.add_listener(self._on_guild_remove, 'on_guild_remove')
+        bot.add_listener(self._on_raw_member_remove, 'on_raw_member_remove')
+        self.compaction.change_interval(minutes=Config.STATE_COMPACT_MINUTES)
+
+    def once(self, func):
+        """Decorator: run on the first READY only"""
+        self._setup_hooks.append(func)
+        return func
+
+    def on_ready(self, func):
+        """Decorator: run on every READY after the first"""
+        self._ready_hooks.append(func)
+        return func
+
+    def on_shard_ready(self, func):
+        """Decorator: run with the shard ID on every shard READY"""
+        self._shard_hooks.append(func)
+        return func
+
+    def on_resume(self, func):
+        """Decorator: run on every RESUMED"""
+        self._resume_hooks.append(func)
+        return func
+
+    def add_warmer(self, func, always=False):
+        """Register a coroutine function called as func(guild) to (re)fill caches"""
+        if all(registered != func for registered, _ in self._warmers):
+            self._warmers.append((func, always))
+
+    def remove_warmer(self, func):
+        self._warmers = [(registered, always) for registered, always in self._warmers if registered != func]
+
+    def track(self, store):
+        """Register an object holding per-guild or per-member state"""
+        if store not in self._stores:
+            self._stores.append(store)
+
+    def untrack(self, store):
+        if store in self._stores:
+            self._stores.remove(store)
+
+    def _notify(self, method, *args):
+        for store in self._stores:
+            func = getattr(store, method, None)
+            if func is None:
+                continue
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f'{type(store).__name__}.{method} failed: {e}')
+
+    def forget_guild(self, guild_id):
+        """Drop everything held for a guild the bot is no longer in"""
+        self._fingerprints.pop(guild_id, None)
+        self._notify('forget_guild', guild_id)
+
+    async def _run_hooks(self, hooks, *args):
+        for hook in hooks:
+            try:
+                await hook(*args)
+            except Exception as e:
+                logger.error(f'Lifecycle hook {hook.__name__} failed: {e}')
+
+    async def _on_ready(self):
+        self.ready_count += 1
+        if not self.setup_done:
+            self.setup_done = True
+            await self._run_hooks(self._setup_hooks)
+            self.compaction.start()
+        else:
+            down_for = time.monotonic() - self.last_disconnect if self.last_disconnect else 0.0
+            logger.info(f'Gateway session re-established after {down_for:.1f}s, refreshing changed guilds only')
+            await self._run_hooks(self._ready_hooks)
+        self.schedule_warm()
+
+    async def _on_shard_ready(self, shard_id):
+        await self._run_hooks(self._shard_hooks, shard_id)
+
+    async def _on_resumed(self):
+        # RESUMED replays every missed event, so cached state is already current
+        self.resume_count += 1
+        await self._run_hooks(self._resume_hooks)
+
+    async def _on_disconnect(self):
+        self.last_disconnect = time.monotonic()
+
+    async def _on_guild_join(self, guild):
+        self.schedule_warm([guild])
+
+    async def _on_guild_available(self, guild):
+        # While a READY is being processed every guild reports in here; the READY warm-up covers those
+        if self.bot.is_ready():
+            self.schedule_warm([guild])
+
+    async def _on_guild_remove(self, guild):
+        self.forget_guild(guild.id)
+        logger.info(f'Dropped cached state for {guild.name} ({guild.id})')
+
+    async def _on_raw_member_remove(self, payload):
+        # Only delivered with the members intent; otherwise TTLs and compaction clean up
+        self._notify('forget_member', payload.guild_id, payload.user.id)
+
+    def compact(self):
+        """Drop state for guilds the bot left without us noticing, returns entries dropped"""
+        active = {guild.id for guild in self.bot.guilds}
+        dropped = 0
+        for guild_id in [guild_id for guild_id in self._fingerprints if guild_id not in active]:
+            del self._fingerprints[guild_id]
+            dropped += 1
+        for store in self._stores:
+            func = getattr(store, 'compact', None)
+            if func is None:
+                continue
+            try:
+                dropped += func(active) or 0
+            except Exception as e:
+                logger.error(f'{type(store).__name__}.compact failed: {e}')
+        return dropped
+
+    @tasks.loop(minutes=30)
+    async def compaction(self):
+        """Periodically compact tracked state down to the guilds the bot is in"""
+        dropped = self.compact()
+        if dropped:
+            logger.info(f'State compaction dropped {dropped} stale entries')
+
+    def changed_guilds(self):
+        """Guilds that were never warmed or whose fingerprint changed since"""
+        return [
+            guild for guild in self.bot.guilds
+            if not guild.unavailable and self._fingerprints.get(guild.id) != guild_fingerprint(guild)
+        ]
+
+    def schedule_warm(self, guilds=None):
+        """Warm the given guilds (default: every changed guild) in the background"""
+        self._warm_task = asyncio.create_task(self._warm(guilds))
+        return self._warm_task
+
+    async def _warm(self, guilds=None):
+        async with self._warm_lock:
+            if guilds is None:
+                guilds = [guild for guild in self.bot.guilds if not guild.unavailable]
+                changed = {guild.id for guild in self.changed_guilds()}
+            else:
+                changed = {guild.id for guild in guilds}
+            if not self._warmers:
+                return 0
+            start = time.perf_counter()
+            for guild in guilds:
+                is_changed = guild.id in changed
+                for warmer, always in self._warmers:
+                    if not (always or is_changed):
+                        continue
+                    try:
+                        await warmer(guild)
+                    except Exception as e:
+                        logger.error(f'Warming {guild.name} with {warmer.__name__} failed: {e}')
+                if is_changed:
+                    self._fingerprints[guild.id] = guild_fingerprint(guild)
+            logger.info(f'Warmed {len(guilds)} guilds, {len(changed)} changed, in {time.perf_counter() - start:.2f}s')
+            return len(changed)
@@ -5,11 +5,13 @@ from datetime import datetime
 def setup_logger():
     """Setup and configure logger"""
     logger = logging.getLogger('discord_bot')
-    logger.setLevel(logging.INFO)
     
-    # Remove existing handlers to avoid duplication
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    # Every module calls this at import; only configure handlers once so
+    # cogs don't reopen bot.log each time they are (re)loaded
+    if logger.handlers:
+        return logger
+    
+    logger.setLevel(logging.INFO)
     
     # Create formatter
     formatter = logging.Formatter(
@@ -0,0 +1,107 @@
+import time
+from collections import OrderedDict
+import discord
+from utils.logger import setup_logger
+from config import Config
+
+logger = setup_logger()
+
+class MemberResolver:
+    """Looks up guild members by ID without keeping a full member cache
+
+    Lookups try the library cache (filled for chunked "hot" guilds), then a
+    small per-guild LRU of recently resolved members, and finally a REST fetch.
+    """
+
+    def __init__(self, bot, size=256, ttl=300):
+        self.bot = bot
+        self.size = size
+        self.ttl = ttl
+        self._cache = {}  # {guild_id: OrderedDict({user_id: (member, expires_at)})}
+
+    def _get_cached(self, guild_id, user_id):
+        entries = self._cache.get(guild_id)
+        if not entries:
+            return None
+        entry = entries.get(user_id)
+        if entry is None:
+            return None
+        member, expires_at = entry
+        if expires_at < time.monotonic():
+            del entries[user_id]
+            return None
+        entries.move_to_end(user_id)
+        return member
+
+    def _store(self, guild_id, member):
+        entries = self._cache.setdefault(guild_id, OrderedDict())
+        entries[member.id] = (member, time.monotonic() + self.ttl)
+        entries.move_to_end(member.id)
+        while len(entries) > self.size:
+            entries.popitem(last=False)
+
+    def invalidate(self, guild_id, user_id):
+        """Drop a cached member, e.g. after their roles changed"""
+        entries = self._cache.get(guild_id)
+        if entries:
+            entries.pop(user_id, None)
+
+    def forget_member(self, guild_id, user_id):
+        self.invalidate(guild_id, user_id)
+
+    def forget_guild(self, guild_id):
+        self._cache.pop(guild_id, None)
+
+    def compact(self, active_guild_ids):
+        """Drop expired members and guilds the bot left, returns how many entries went"""
+        now = time.monotonic()
+        dropped = 0
+        for guild_id in list(self._cache):
+            entries = self._cache[guild_id]
+            if guild_id in active_guild_ids:
+                expired = [user_id for user_id, (_, expires_at) in entries.items() if expires_at < now]
+                for user_id in expired:
+                    del entries[user_id]
+                dropped += len(expired)
+                if entries:
+                    continue
+            else:
+                dropped += len(entries)
+            del self._cache[guild_id]
+        return dropped
+
+    async def resolve(self, guild, user_id, fresh=False):
+        """Return the guild's member with this ID, or None if they aren't in it
+
+        Pass fresh=True before acting on the member's roles or timeout: the LRU
+        can be up to ttl seconds behind changes other moderators made. The
+        library cache is kept current by gateway events and is always used.
+        """
+        member = guild.get_member(user_id)
+        if member is None and not fresh:
+            member = self._get_cached(guild.id, user_id)
+        if member is not None:
+            return member
+
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.NotFound:
+            return None
+        self._store(guild.id, member)
+        return member
+
+    def clear(self):
+        """Drop every cached member, e.g. when a new session replaced the Guild objects they point at"""
+        self._cache.clear()
+
+    async def warm_guild(self, guild):
+        """Lifecycle warmer (runs on every READY): chunk the guild again if it's hot"""
+        self._cache.pop(guild.id, None)
+        if not self.bot.intents.members or guild.id not in Config.HOT_GUILD_IDS or guild.chunked:
+            return
+        await guild.chunk(cache=True)
+        logger.info(f'Chunked hot guild {guild.name} ({guild.member_count} members)')
+
+    def cached_count(self):
+        """Number of members held in the LRU across all guilds"""
+        return sum(len(entries) for entries in self._cache.values())
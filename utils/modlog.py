@@ -0,0 +1,146 @@
+import asyncio
+import time
+import discord
+from utils.logger import setup_logger
+from config import Config
+
+logger = setup_logger()
+
+MAX_EMBEDS_PER_MESSAGE = 10  # Discord's limit per message
+
+def modlog_embed(action, target, moderator, reason=None, color=None):
+    """Build the embed recorded in a guild's mod-log channel"""
+    embed = discord.Embed(
+        title=action,
+        description=f"**{target}** (`{target.id}`)",
+        color=color or discord.Color.dark_grey(),
+        timestamp=discord.utils.utcnow()
+    )
+    if reason:
+        embed.add_field(name="Reason", value=reason, inline=False)
+    embed.add_field(name="Moderator", value=str(moderator), inline=True)
+    return embed
+
+class ModLogDispatcher:
+    """Queues mod-log events and delivers them in batches through channel webhooks
+
+    Events are coalesced per channel for a short window and sent up to ten
+    embeds per message. Webhooks have their own rate-limit buckets, so log
+    traffic never delays interaction responses.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.queue = asyncio.Queue(maxsize=Config.MODLOG_QUEUE_SIZE)
+        self.webhooks = {}  # {channel_id: discord.Webhook}
+        self._webhook_retry_at = {}  # {channel_id: monotonic time} after a refused webhook lookup
+        self.dropped = 0
+        self._task = None
+
+    def start(self):
+        """Start the delivery task"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name='modlog-dispatcher')
+
+    def stop(self):
+        """Stop the delivery task"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def log(self, guild, embed):
+        """Queue an embed for the guild's mod-log channel, if it has one"""
+        channel_id = self.bot.guild_config.get(guild.id)['log_channel_id']
+        if channel_id is None:
+            return
+        try:
+            self.queue.put_nowait((channel_id, embed))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped % 100 == 1:
+                logger.warning(f'Mod-log queue full, dropped {self.dropped} events so far')
+
+    def _prune_webhooks(self, keep):
+        stale = [
+            channel_id for channel_id in self.webhooks
+            if (channel := self.bot.get_channel(channel_id)) is None or not keep(channel.guild.id)
+        ]
+        for channel_id in stale:
+            del self.webhooks[channel_id]
+        for channel_id in list(self._webhook_retry_at):
+            channel = self.bot.get_channel(channel_id)
+            if channel is None or not keep(channel.guild.id):
+                del self._webhook_retry_at[channel_id]
+        return len(stale)
+
+    def forget_guild(self, guild_id):
+        """Drop cached webhooks for a guild the bot left"""
+        self._prune_webhooks(lambda channel_guild_id: channel_guild_id != guild_id)
+
+    def compact(self, active_guild_ids):
+        """Drop cached webhooks for deleted channels and guilds the bot left"""
+        return self._prune_webhooks(lambda channel_guild_id: channel_guild_id in active_guild_ids)
+
+    async def _run(self):
+        while True:
+            batch = [await self.queue.get()]
+            # Give bursts (global actions, bulk mutes) a moment to pile up
+            await asyncio.sleep(Config.MODLOG_FLUSH_SECONDS)
+            while not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            by_channel = {}
+            for channel_id, embed in batch:
+                by_channel.setdefault(channel_id, []).append(embed)
+
+            for channel_id, embeds in by_channel.items():
+                for i in range(0, len(embeds), MAX_EMBEDS_PER_MESSAGE):
+                    try:
+                        await self._deliver(channel_id, embeds[i:i + MAX_EMBEDS_PER_MESSAGE])
+                    except Exception as e:
+                        logger.error(f'Failed to deliver mod-log to channel {channel_id}: {e}')
+
+    async def _deliver(self, channel_id, embeds):
+        channel = self.bot.get_channel(channel_id)
+        if not isinstance(channel, discord.TextChannel):
+            return
+
+        webhook = await self._get_webhook(channel)
+        if webhook is None:
+            # No Manage Webhooks permission, fall back to a regular message
+            await channel.send(embeds=embeds)
+            return
+
+        try:
+            await webhook.send(embeds=embeds, username=Config.MODLOG_WEBHOOK_NAME)
+        except discord.NotFound:
+            # Webhook was deleted, recreate it next time
+            self.webhooks.pop(channel_id, None)
+            raise
+
+    async def _get_webhook(self, channel):
+        webhook = self.webhooks.get(channel.id)
+        if webhook is not None:
+            return webhook
+
+        # Checked locally on every delivery, so a newly granted permission is picked up right away
+        if not channel.permissions_for(channel.guild.me).manage_webhooks:
+            return None
+        if self._webhook_retry_at.get(channel.id, 0) > time.monotonic():
+            return None
+
+        try:
+            for existing in await channel.webhooks():
+                if existing.user and existing.user.id == self.bot.user.id and existing.name == Config.MODLOG_WEBHOOK_NAME:
+                    webhook = existing
+                    break
+            else:
+                webhook = await channel.create_webhook(name=Config.MODLOG_WEBHOOK_NAME, reason="Moderation log")
+        except discord.Forbidden:
+            # Permission overwrites we can't see locally; don't ask again on every batch
+            self._webhook_retry_at[channel.id] = time.monotonic() + Config.MODLOG_WEBHOOK_RETRY_SECONDS
+            return None
+
+        self._webhook_retry_at.pop(channel.id, None)
+        self.webhooks[channel.id] = webhook
+        return webhook
@@ -0,0 +1,91 @@
+import sys
+import time
+
+class _TimedLoader:
+    """Loader wrapper that times module execution"""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__, time.perf_counter() - start)
+
+class StartupProfiler:
+    """Records per-module import time and per-cog setup time during startup"""
+
+    def __init__(self, enabled=False, process_start=None):
+        self.enabled = enabled
+        self.process_start = process_start or time.perf_counter()
+        self.import_times = {}  # {module_name: (inclusive_seconds, self_seconds)}
+        self.cog_times = {}  # {extension: (import_seconds, setup_seconds)}
+        self.first_interaction = None
+        self._child_time = [0.0]
+
+    def install(self):
+        """Start timing imports (no-op unless enabled)"""
+        if self.enabled and self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        """Stop timing imports"""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        """Meta path hook: delegate to the real finders and wrap the loader"""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            # Builtin and frozen importers are shared classes, leave them alone
+            if spec.loader is not None and not isinstance(spec.loader, type) and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+        return None
+
+    def _enter(self):
+        self._child_time.append(0.0)
+
+    def _exit(self, name, elapsed):
+        children = self._child_time.pop()
+        self._child_time[-1] += elapsed
+        self.import_times[name] = (elapsed, elapsed - children)
+
+    def record_cog(self, extension, elapsed):
+        """Split a load_extension call into import time and setup() time"""
+        if not self.enabled:
+            return
+        imported = self.import_times.get(extension, (0.0, 0.0))[0]
+        self.cog_times[extension] = (imported, max(elapsed - imported, 0.0))
+
+    def mark_first_interaction(self):
+        """Record time from process start to the first interaction handled"""
+        if self.first_interaction is None:
+            self.first_interaction = time.perf_counter() - self.process_start
+            return True
+        return False
+
+    def report(self, logger, top=15):
+        """Log the slowest imports and every cog's load time"""
+        if not self.enabled:
+            return
+        slowest = sorted(self.import_times.items(), key=lambda item: item[1][1], reverse=True)
+        logger.info(f'Startup profile: {len(self.import_times)} modules imported, slowest by self time:')
+        for name, (inclusive, own) in slowest[:top]:
+            logger.info(f'  {own * 1000:8.1f} ms self  {inclusive * 1000:8.1f} ms total  {name}')
+        for extension, (imported, setup) in self.cog_times.items():
+            logger.info(f'  cog {extension}: import {imported * 1000:.1f} ms, setup {setup * 1000:.1f} ms')
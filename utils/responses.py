@@ -0,0 +1,106 @@
+import discord
+from functools import lru_cache
+from itertools import islice
+
+FIELD_VALUE_LIMIT = 1024  # Discord's limit for an embed field value
+
+class FrozenEmbed(discord.Embed):
+    """Embed shared between responses; raises if anything tries to modify it"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        object.__setattr__(self, '_frozen', True)
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise TypeError('Response templates are shared and read-only, use copy() to modify one')
+        super().__setattr__(name, value)
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('Response templates are shared and read-only, use copy() to modify one')
+
+    add_field = insert_field_at = set_field_at = remove_field = clear_fields = _read_only
+    set_author = remove_author = set_footer = remove_footer = set_image = set_thumbnail = _read_only
+
+    @classmethod
+    def from_dict(cls, data):
+        self = super().from_dict(data)
+        object.__setattr__(self, '_frozen', True)
+        return self
+
+    def copy(self):
+        """Return a regular, editable copy"""
+        return discord.Embed.from_dict(self.to_dict())
+
+@lru_cache(maxsize=128)
+def error(description, title="❌ Error"):
+    """Red error embed, built once per distinct message"""
+    return FrozenEmbed(title=title, description=description, color=discord.Color.red())
+
+def missing_permissions(description):
+    return error(description, "❌ Missing Permissions")
+
+def insufficient_permissions(description):
+    return error(description, "❌ Insufficient Permissions")
+
+def owner_protection(description="Cannot moderate the bot owner!"):
+    return error(description, "🛡️ Owner Protection")
+
+ACCESS_DENIED = error("Only the bot owner can use this command.", "🔒 Access Denied")
+INVALID_USER_ID = error("Please provide a valid user ID.")
+INVALID_SERVER_ID = error("Please provide a valid server ID.")
+USER_NOT_FOUND = error("User not found.")
+UNEXPECTED_ERROR = error("An unexpected error occurred. Please try again later.")
+
+class ResultSummary:
+    """Tallies per-guild outcomes of a global action
+
+    Only the first few names of each outcome are kept, so the summary stays
+    the same size however many guilds the bot is in.
+    """
+
+    __slots__ = ('succeeded', 'failed', '_succeeded_names', '_failed_names', '_limit')
+
+    def __init__(self, limit=10):
+        self.succeeded = 0
+        self.failed = 0
+        self._succeeded_names = []
+        self._failed_names = []
+        self._limit = limit
+
+    def success(self, name):
+        self.succeeded += 1
+        if len(self._succeeded_names) < self._limit:
+            self._succeeded_names.append(name)
+
+    def failure(self, name):
+        self.failed += 1
+        if len(self._failed_names) < self._limit:
+            self._failed_names.append(name)
+
+    @staticmethod
+    def _name_list(names, total):
+        value = "\n".join(names) + ("..." if total > len(names) else "")
+        return value[:FIELD_VALUE_LIMIT]
+
+    def render(self, embed, label):
+        """Add the count fields and the (truncated) server lists to an embed"""
+        embed.add_field(name=label, value=f"{self.succeeded} servers", inline=True)
+        embed.add_field(name="Failed", value=f"{self.failed} servers", inline=True)
+
+        if self.succeeded:
+            embed.add_field(name="Success", value=self._name_list(self._succeeded_names, self.succeeded), inline=False)
+
+        if self.failed:
+            embed.add_field(name="Failed Servers", value=self._name_list(self._failed_names, self.failed), inline=False)
+
+        return embed
+
+def pages(lines, per_page=20):
+    """Yield lists of at most per_page lines without building them all up front"""
+    lines = iter(lines)
+    while True:
+        page = list(islice(lines, per_page))
+        if not page:
+            return
+        yield page
@@ -0,0 +1,87 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from utils.logger import setup_logger
+
+logger = setup_logger()
+
+class LoopWatchdog:
+    """Measures event loop lag and samples the loop thread's stack when it stalls
+
+    A task on the loop wakes up every `interval` seconds and records how late
+    it was. A separate thread watches that heartbeat; if the loop misses it by
+    more than `threshold`, the thread grabs the stack the loop is stuck in.
+    """
+
+    def __init__(self, interval=0.5, threshold=0.25, history=600):
+        self.interval = interval
+        self.threshold = threshold
+        self.lags = deque(maxlen=history)  # Recent lag samples in seconds
+        self.max_lag = 0.0
+        self.stalls = 0
+        self.slow_callbacks = deque(maxlen=10)  # (timestamp, stalled_seconds, stack)
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id = None
+        self._task = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Start measuring; must be called from the event loop"""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._measure(), name='loop-watchdog')
+        self._thread = threading.Thread(target=self._sample, name='loop-watchdog-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop measuring"""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _measure(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - start - self.interval, 0.0)
+            self.lags.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+            self._heartbeat = time.monotonic()
+
+    def _sample(self):
+        reported = None
+        while not self._stopped.wait(self.threshold / 2):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat - self.interval
+            if stalled < self.threshold or heartbeat == reported:
+                continue
+
+            # Report each stall once, with the stack the loop is blocked in
+            reported = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = ''.join(traceback.format_stack(frame)) if frame else '<no frame>'
+            self.stalls += 1
+            self.slow_callbacks.append((time.time(), stalled, stack))
+            logger.warning(f'Event loop blocked for {stalled:.2f}s+, loop thread stack:\n{stack}')
+
+    def stats(self):
+        """Return current, p50, p95 and max lag plus the stall count"""
+        samples = sorted(self.lags)
+        if not samples:
+            return {'current': 0.0, 'p50': 0.0, 'p95': 0.0, 'max': self.max_lag, 'stalls': self.stalls}
+        return {
+            'current': self.lags[-1],
+            'p50': samples[len(samples) // 2],
+            'p95': samples[min(int(len(samples) * 0.95), len(samples) - 1)],
+            'max': self.max_lag,
+            'stalls': self.stalls,
+        }